@@ -68,6 +68,51 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(snapshot_3.has_incremental_base())
         self.assertEqual(snapshot_3.get_incremental_base(), snapshot_2)
 
+    def test_build_incremental_snapshot_refs_after_gap(self):
+        dataset = DataSet("test", "test")
+
+        snapshot_prefix = "test"
+        initial_snapshot = Snapshot("test", "test",
+                                    snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX)
+        snapshot_2 = Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "2")
+        snapshot_3 = Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "3")
+        snapshot_4 = Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "4")
+
+        # snapshot_1 is missing
+        dataset.add_snapshot(initial_snapshot)
+        dataset.add_snapshot(snapshot_2)
+        dataset.add_snapshot(snapshot_3)
+        dataset.add_snapshot(snapshot_4)
+
+        dataset.build_incremental_snapshot_refs()
+
+        # no snapshot after the gap is linked, not even consecutive ones
+        self.assertFalse(initial_snapshot.has_incremental_base())
+        self.assertFalse(snapshot_2.has_incremental_base())
+        self.assertFalse(snapshot_3.has_incremental_base())
+        self.assertFalse(snapshot_4.has_incremental_base())
+        self.assertFalse(dataset.has_incremental_snapshot_refs())
+
+    def test_build_incremental_snapshot_refs_multi_digit_index(self):
+        dataset = DataSet("test", "test")
+
+        snapshot_prefix = "test"
+        snapshots = [Snapshot("test", "test",
+                              snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX)]
+        for index in range(1, 12):
+            snapshots.append(Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + str(index)))
+
+        # without creation times, the zfs path order would put 'test.10' before 'test.2'
+        for snapshot in reversed(snapshots):
+            dataset.add_snapshot(snapshot)
+
+        dataset.build_incremental_snapshot_refs()
+
+        self.assertFalse(snapshots[0].has_incremental_base())
+        for incremental_base, snapshot in zip(snapshots, snapshots[1:]):
+            self.assertTrue(snapshot.has_incremental_base())
+            self.assertEqual(snapshot.get_incremental_base(), incremental_base)
+
     def test_no_backpropagate_incremental_snapshot_refs(self):
         dataset = DataSet("test", "test")
 
@@ -248,7 +293,50 @@ class MyTestCase(unittest.TestCase):
         self.assertFalse(mixed_snapshot_3.has_incremental_base())
         self.assertFalse(mixed_snapshot_4.has_incremental_base())
 
+    def test_get_incremental_children(self):
+        dataset = DataSet("test", "test")
+
+        snapshot_prefix = "test"
+        initial_snapshot = Snapshot("test", "test",
+                                    snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX)
+        snapshot_1 = Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "1")
+        snapshot_2 = Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "2")
+        snapshot_3 = Snapshot("test", "test", snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "3")
+
+        dataset.add_snapshot(initial_snapshot)
+        dataset.add_snapshot(snapshot_1)
+        dataset.add_snapshot(snapshot_3)
+        dataset.build_incremental_snapshot_refs()
 
+        # parent is part of the dataset, the parent itself is not a child
+        children = dataset.get_incremental_children(snapshot_1)
+        self.assertEqual([snapshot.zfs_path for snapshot in children], [snapshot_3.zfs_path])
+        self.assertFalse(children.snapshots[snapshot_3.zfs_path] is snapshot_3)
+
+        # parent is missing in the dataset, it completes the incremental chain
+        children = dataset.get_incremental_children(snapshot_2)
+        self.assertEqual([snapshot.zfs_path for snapshot in children], [snapshot_3.zfs_path])
+        self.assertEqual(children.snapshots[snapshot_3.zfs_path].get_incremental_base(), snapshot_2)
+
+        # the original dataset is not modified
+        self.assertEqual(len(dataset.snapshots), 3)
+        self.assertFalse(snapshot_3.has_incremental_base())
+
+
+    def test_has_incremental_snapshot_refs_after_set_incremental_base(self):
+        dataset = DataSet("test", "test")
+        initial_snapshot = Snapshot("test", "test", "test" + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX)
+        snapshot_1 = Snapshot("test", "test", "test" + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + "1")
+        dataset.add_snapshot(initial_snapshot)
+        dataset.add_snapshot(snapshot_1)
+        self.assertFalse(dataset.has_incremental_snapshot_refs())
+
+        # refs set on a snapshot the dataset already holds are seen by the dataset
+        snapshot_1.set_incremental_base(initial_snapshot)
+        self.assertTrue(dataset.has_incremental_snapshot_refs())
+
+        snapshot_1.set_incremental_base(None)
+        self.assertFalse(dataset.has_incremental_snapshot_refs())
 
 
 if __name__ == '__main__':
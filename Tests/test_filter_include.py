@@ -0,0 +1,53 @@
+import unittest
+
+from ZfsBackupTool.Zfs import DataSet, Snapshot, Pool, PoolList
+
+
+def make_backup_dataset(pool_name: str, dataset_name: str) -> DataSet:
+    dataset = DataSet(pool_name, dataset_name)
+    for snapshot_name in ("bk.initial", "bk.1", "bk.2"):
+        dataset.add_snapshot(Snapshot(pool_name, dataset_name, snapshot_name))
+    return dataset
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.pool_1 = Pool("p1")
+        self.pool_1.add_dataset(make_backup_dataset("p1", "a"))
+        self.pool_1.add_dataset(make_backup_dataset("p1", "a/b"))
+        self.pool_2 = Pool("p2")
+        self.pool_2.add_dataset(make_backup_dataset("p2", "a"))
+        self.poollist = PoolList(self.pool_1, self.pool_2)
+
+    def test_pool_filter_snapshot_prefix(self):
+        filtered = self.pool_1.filter_include_by_zfs_path_prefix("p1/a@bk.2")
+        self.assertEqual([dataset.zfs_path for dataset in filtered], ["p1/a"])
+        self.assertEqual([snapshot.zfs_path for snapshot in filtered.iter_snapshots()], ["p1/a@bk.2"])
+
+        # a snapshot prefix of another pool matches nothing
+        self.assertFalse(self.pool_2.filter_include_by_zfs_path_prefix("p1/a@bk.2").has_datasets())
+
+    def test_pool_filter_dataset_prefix(self):
+        filtered = self.pool_1.filter_include_by_zfs_path_prefix("p1/a/")
+        self.assertEqual([dataset.zfs_path for dataset in filtered], ["p1/a/b"])
+        self.assertEqual(len(list(filtered.iter_snapshots())), 3)
+
+        filtered = self.pool_1.filter_include_by_zfs_path_prefix("p1/a")
+        self.assertEqual([dataset.zfs_path for dataset in filtered], ["p1/a", "p1/a/b"])
+
+    def test_poollist_filter_snapshot_prefix(self):
+        filtered = self.poollist.filter_include_by_zfs_path_prefix("p1/a@bk.")
+        self.assertEqual([pool.pool_name for pool in filtered], ["p1"])
+        self.assertEqual([snapshot.zfs_path for snapshot in filtered.iter_snapshots()],
+                         ["p1/a@bk.initial", "p1/a@bk.1", "p1/a@bk.2"])
+
+        filtered = self.poollist.filter_include_by_zfs_path_prefix("p2/a@bk.1")
+        self.assertEqual([snapshot.zfs_path for snapshot in filtered.iter_snapshots()], ["p2/a@bk.1"])
+
+        # the filter creates views, the original pool list is unchanged
+        self.assertEqual(len(list(self.poollist.iter_snapshots())), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from ZfsBackupTool.Zfs import PoolList
 from Tests.helpers import make_dataset, make_pool, make_poollist, pop_random_snapshot
 
 
@@ -168,5 +169,18 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(reverse_set_intersect, {snapshot.zfs_path for snapshot in reverse_intersect.iter_snapshots()})
 
 
+    def test_poollist_intersect_empty_base(self):
+        poollist_1 = make_poollist(2, 2, 3)
+        poollist_2 = poollist_1.view()
+
+        # the pools of the other pool lists are intersected with each other, even if this pool list is empty
+        intersect = PoolList().intersection(poollist_1, poollist_2)
+        self.assertEqual(intersect, poollist_1.intersection(poollist_2))
+        self.assertEqual([pool.pool_name for pool in intersect], ["pool_0", "pool_1"])
+
+        # without other pool lists, there is nothing to intersect with
+        self.assertEqual(list(poollist_1.intersection()), [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from ZfsBackupTool.Zfs import PoolList
+from Tests.helpers import make_poollist, pop_random_snapshot
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_poollist_merge(self):
+        poollist_1 = make_poollist(2, 2, 5)
+        poollist_2 = poollist_1.view()
+        random_snapshot = pop_random_snapshot(poollist_1)
+
+        merged = PoolList.merge(poollist_1, poollist_2)
+        self.assertEqual(merged, poollist_2)
+        self.assertIn(random_snapshot.zfs_path, {snapshot.zfs_path for snapshot in merged.iter_snapshots()})
+
+    def test_poollist_merge_iterable(self):
+        poollist_1 = make_poollist(2, 2, 5)
+        poollist_2 = poollist_1.view()
+        pop_random_snapshot(poollist_1)
+
+        # pool lists can also be given as an iterable of pool lists
+        self.assertEqual(PoolList.merge([poollist_1, poollist_2]), PoolList.merge(poollist_1, poollist_2))
+        self.assertEqual(PoolList.merge([poollist_1]), poollist_1)
+
+
+    def test_poollist_operations_pool_iterable(self):
+        poollist_1 = make_poollist(2, 2, 5)
+        poollist_2 = poollist_1.view()
+        pop_random_snapshot(poollist_1)
+        pools_2 = list(poollist_2)
+
+        # pool lists can also be given as an iterable of pools
+        self.assertEqual(PoolList.merge(poollist_1, pools_2), PoolList.merge(poollist_1, poollist_2))
+        self.assertEqual(poollist_2.difference(list(poollist_1)), poollist_2.difference(poollist_1))
+        self.assertEqual(poollist_2.intersection(list(poollist_1)), poollist_2.intersection(poollist_1))
+
+        with self.assertRaises(ValueError):
+            PoolList.merge(poollist_1, [42])
+        with self.assertRaises(ValueError):
+            poollist_1.difference(42)  # type: ignore
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from Tests.helpers import make_poollist
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_poollist_contains(self):
+        poollist = make_poollist(2, 2, 3)
+        pool = list(poollist)[0]
+
+        self.assertIn(pool, poollist)
+        self.assertIn(pool.view(), poollist)
+        self.assertIn(pool.pool_name, poollist)
+        self.assertNotIn("missing", poollist)
+
+        # unsupported types are never part of the pool list
+        self.assertNotIn(None, poollist)
+        self.assertNotIn(42, poollist)
+        self.assertNotIn(list(pool)[0], poollist)
+
+
+if __name__ == '__main__':
+    unittest.main()
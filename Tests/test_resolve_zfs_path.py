@@ -0,0 +1,38 @@
+import unittest
+
+from ZfsBackupTool.Zfs import ZfsResolveError
+from Tests.helpers import make_dataset, make_poollist
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_dataset_resolve_zfs_path(self):
+        dataset = make_dataset("test", "test", 3)
+        snapshot = list(dataset)[1]
+
+        self.assertIs(dataset.resolve_zfs_path(snapshot.zfs_path), snapshot)
+
+        with self.assertRaises(ZfsResolveError):
+            dataset.resolve_zfs_path("test/test@missing")
+        with self.assertRaises(ZfsResolveError):
+            # snapshot name of this dataset, but below another dataset
+            dataset.resolve_zfs_path("test/other@" + snapshot.snapshot_name)
+
+    def test_poollist_resolve_zfs_path(self):
+        poollist = make_poollist(2, 2, 3)
+        dataset = list(poollist.iter_datasets())[-1]
+        snapshot = list(dataset)[-1]
+
+        self.assertIs(poollist.resolve_zfs_path(dataset.zfs_path), dataset)
+        self.assertIs(poollist.resolve_zfs_path(snapshot.zfs_path), snapshot)
+        self.assertIs(poollist.resolve_zfs_path(dataset.pool_name), poollist.pools[dataset.pool_name])
+        self.assertIs(poollist.get_dataset_by_path(snapshot.zfs_path), dataset)
+
+        with self.assertRaises(ZfsResolveError):
+            poollist.resolve_zfs_path(dataset.zfs_path + "@missing")
+        with self.assertRaises(ZfsResolveError):
+            poollist.resolve_zfs_path("missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime
+
+from ZfsBackupTool.ShellCommand import ShellCommand
+from ZfsBackupTool.Zfs import scan_zfs_pools
+
+# sample output of 'zfs list -H -p -r -o name,creation -t snapshot "tank"'
+SNAPSHOT_LIST_OUTPUT = [
+    "tank@root\t1700000000",
+    "tank/a@bk.initial\t1700000000",
+    "tank/a@bk.1\t1700000100",
+    "tank/a/b@bk.initial\t1700000050",
+    "tank/my data@bk.initial\t1700000200",
+]
+
+# sample output of 'zfs list -p -H -r -o name,refer "tank"'
+DATASET_SIZE_OUTPUT = [
+    "tank\t100",
+    "tank/a\t200",
+    "tank/a/b\t300",
+    "tank/c\t0",
+    "tank/my data\t400",
+]
+
+
+def make_shell_command() -> ShellCommand:
+    shell_command = ShellCommand()
+
+    def execute_read_lines(command: str):
+        if "-t snapshot" in command:
+            return SNAPSHOT_LIST_OUTPUT
+        if "name,refer" in command:
+            return DATASET_SIZE_OUTPUT
+        raise AssertionError("Unexpected command: {}".format(command))
+
+    shell_command._execute_read_lines = execute_read_lines  # type: ignore
+    shell_command.list_pools = lambda: ["tank"]  # type: ignore
+    shell_command.list_datasets = lambda zfs_parts_prefix: ["a", "a/b", "c", "my data", "new"]  # type: ignore
+    return shell_command
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_list_snapshots_with_creation_time_recursive(self):
+        snapshots = make_shell_command().list_snapshots_with_creation_time_recursive("tank")
+
+        # snapshots are grouped by their own dataset, not by a parent dataset
+        self.assertEqual(snapshots, {
+            "tank": [("root", datetime.fromtimestamp(1700000000))],
+            "tank/a": [("bk.initial", datetime.fromtimestamp(1700000000)),
+                       ("bk.1", datetime.fromtimestamp(1700000100))],
+            "tank/a/b": [("bk.initial", datetime.fromtimestamp(1700000050))],
+            "tank/my data": [("bk.initial", datetime.fromtimestamp(1700000200))],
+        })
+
+    def test_get_dataset_sizes_recursive(self):
+        dataset_sizes = make_shell_command().get_dataset_sizes_recursive("tank")
+        self.assertEqual(dataset_sizes, {"tank": 100, "tank/a": 200, "tank/a/b": 300, "tank/c": 0,
+                                         "tank/my data": 400})
+
+    def test_scan_zfs_pools(self):
+        pools = scan_zfs_pools(make_shell_command(), include_dataset_sizes=True)
+
+        # datasets without snapshots are part of the scan, snapshots of the pool itself are not
+        self.assertEqual([dataset.zfs_path for dataset in pools.iter_datasets()], ["tank/a", "tank/a/b", "tank/c", "tank/my data", "tank/new"])
+        self.assertEqual([snapshot.zfs_path for snapshot in pools.iter_snapshots()],
+                         ["tank/a@bk.initial", "tank/a@bk.1", "tank/a/b@bk.initial", "tank/my data@bk.initial"])
+        self.assertFalse(pools.get_dataset_by_path("tank/c").has_snapshots())
+        self.assertEqual(pools.get_dataset_by_path("tank/a/b").dataset_size, 300)
+        self.assertEqual(pools.get_dataset_by_path("tank/my data").dataset_size, 400)
+        # created between the dataset and the size listing, the size stays unset
+        self.assertFalse(pools.get_dataset_by_path("tank/new").has_dataset_size())
+        self.assertEqual(pools.resolve_zfs_path("tank/a@bk.1").get_creation_time(),  # type: ignore
+                         datetime.fromtimestamp(1700000100))
+
+
+if __name__ == '__main__':
+    unittest.main()
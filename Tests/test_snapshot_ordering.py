@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime, timedelta
+
+from ZfsBackupTool.Zfs import DataSet, Snapshot
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_sort_by_creation_time(self):
+        now = datetime.now()
+        snapshot_a = Snapshot("test", "test", "a")
+        snapshot_a.set_creation_time(now + timedelta(seconds=2))
+        snapshot_b = Snapshot("test", "test", "b")
+        snapshot_b.set_creation_time(now)
+        snapshot_c = Snapshot("test", "test", "c")
+        snapshot_c.set_creation_time(now + timedelta(seconds=1))
+
+        self.assertEqual(DataSet.sort_snapshots([snapshot_a, snapshot_b, snapshot_c]),
+                         [snapshot_b, snapshot_c, snapshot_a])
+
+    def test_sort_without_creation_time(self):
+        snapshot_initial = Snapshot("test", "test", "test.initial")
+        snapshot_a = Snapshot("test", "test", "test.a")
+        snapshot_b = Snapshot("test", "test", "test.b")
+        snapshot_b.set_creation_time(datetime.now())
+
+        # falls back to the zfs path with initial snapshots first, if not all snapshots have a creation time
+        self.assertEqual(DataSet.sort_snapshots([snapshot_b, snapshot_a, snapshot_initial]),
+                         [snapshot_initial, snapshot_a, snapshot_b])
+
+    def test_sorted_order_follows_changes(self):
+        dataset = DataSet("test", "test")
+        snapshot_1 = Snapshot("test", "test", "test.1")
+        snapshot_2 = Snapshot("test", "test", "test.2")
+        initial_snapshot = Snapshot("test", "test", "test.initial")
+
+        dataset.add_snapshot(snapshot_2)
+        dataset.add_snapshot(snapshot_1)
+        self.assertEqual(list(dataset), [snapshot_1, snapshot_2])
+
+        dataset.add_snapshot(initial_snapshot)
+        self.assertEqual(list(dataset), [initial_snapshot, snapshot_1, snapshot_2])
+
+        # removing while iterating must not disturb the running iteration
+        for snapshot in dataset:
+            dataset.remove_snapshot(snapshot)
+        self.assertEqual(list(dataset), [])
+
+
+    def test_sorted_order_follows_creation_times(self):
+        now = datetime.now()
+        dataset = DataSet("test", "test")
+        snapshot_a = Snapshot("test", "test", "test.a")
+        snapshot_b = Snapshot("test", "test", "test.b")
+        dataset.add_snapshot(snapshot_a)
+        dataset.add_snapshot(snapshot_b)
+        self.assertEqual(list(dataset), [snapshot_a, snapshot_b])
+
+        # creation times set after adding the snapshots change the cached order
+        snapshot_a.set_creation_time(now + timedelta(seconds=1))
+        snapshot_b.set_creation_time(now)
+        self.assertEqual(list(dataset), [snapshot_b, snapshot_a])
+
+        snapshot_a.set_creation_time(now - timedelta(seconds=1))
+        self.assertEqual(list(dataset), [snapshot_a, snapshot_b])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from ZfsBackupTool.ShellCommand import ShellCommand
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_target_walk_directory(self):
+        # output of two ls calls, find splits long directory lists into multiple calls
+        walk_output = [
+            "/backup/pool:",
+            "a/",
+            "c/",
+            "",
+            "/backup/pool/a:",
+            "b/",
+            "s.1.zfs",
+            "s.1.zfs.sha256",
+            "s.1.zfs.calculated_sha256*",
+            "",
+            "/backup/pool/a/b:",
+            "",
+            "/backup/pool:",
+            "a/",
+            "c/",
+            "",
+            "/backup/pool/c:",
+            "s.1.zfs",
+            "link.zfs@",
+            "fifo|",
+        ]
+        executed_commands = []
+
+        def execute_read_lines(command: str):
+            executed_commands.append(command)
+            return walk_output
+
+        shell_command = ShellCommand()
+        shell_command._execute_read_lines = execute_read_lines  # type: ignore
+
+        directories = shell_command.target_walk_directory("/backup/pool/")
+
+        # a single POSIX find call, no GNU only options
+        self.assertEqual(len(executed_commands), 1)
+        self.assertNotIn("-printf", executed_commands[0])
+        self.assertIn('find "/backup/pool" -type d', executed_commands[0])
+
+        self.assertEqual(directories, {
+            '': ([], ["a", "c"]),
+            'a': (["s.1.zfs", "s.1.zfs.sha256", "s.1.zfs.calculated_sha256"], ["b"]),
+            'a/b': ([], []),
+            # symlinks and other special files are skipped, like target_list_directory does
+            'c': (["s.1.zfs"], []),
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ from ..ShellCommand import SshHost
 from ..Zfs import DataSet, Snapshot, PoolList, ZfsResolveError
 from ..Zfs.errors import ZfsParseError
 
+_INITIAL_SNAPSHOT_SUFFIX = SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX
+
 
 class PlanningException(Exception):
     pass
@@ -15,9 +17,9 @@ def get_next_backup_snapshot_for_dataset(dataset: DataSet, snapshot_prefix: str)
     Get the next needed snapshots for a dataset.
     """
     backup_snapshots = []
-    for snapshot_name in sorted(dataset.snapshots.keys()):
-        snapshot = dataset.snapshots[snapshot_name]
-        if snapshot.snapshot_name.startswith(snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR):
+    backup_snapshot_name_prefix = snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR
+    for snapshot in dataset.sorted_snapshots():
+        if snapshot.snapshot_name.startswith(backup_snapshot_name_prefix):
             backup_snapshots.append(snapshot)
 
     if not backup_snapshots:
@@ -26,12 +28,12 @@ def get_next_backup_snapshot_for_dataset(dataset: DataSet, snapshot_prefix: str)
                                         SNAPSHOT_PREFIX_POSTFIX_SEPARATOR,
                                         INITIAL_SNAPSHOT_POSTFIX))
 
-    # the initial snapshot can be the last one due to the sorting
-    # we need to correct the snapshot order by moving the initial snapshot to the beginning
+    # sort_snapshots picks its key by whether all given snapshots have a creation time, so the backup snapshots
+    # may need a different order than the dataset. the input is mostly sorted already, the re-sort is cheap.
     backup_snapshots = DataSet.sort_snapshots(backup_snapshots)
 
     last_snapshot = backup_snapshots[-1]
-    last_snapshot_number = last_snapshot.snapshot_name.split(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR)[-1]
+    last_snapshot_number = last_snapshot.snapshot_name.rpartition(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR)[2]
     # number can also be "initial"
     if last_snapshot_number == INITIAL_SNAPSHOT_POSTFIX:
         next_snapshot_number = 1
@@ -258,7 +260,7 @@ def find_conflicting_intermediate_snapshots(repair_diff: PoolList, complete_targ
         # to avoid a resolution error, we must skip the 'initial' snapshot, because it has no base.
 
         first_repair_snapshot = list(dataset.iter_snapshots())[0]
-        if first_repair_snapshot.snapshot_name.endswith(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX):
+        if first_repair_snapshot.snapshot_name.endswith(_INITIAL_SNAPSHOT_SUFFIX):
             # initial snapshots have no incremental base, so we cannot find any conflicting snapshots reliably
             # to go even further, we couldn't even restore the snapshot, because zfs receive would fail
             # this case is better handled by the find_initial_conflicting_snapshots method
@@ -288,7 +290,7 @@ def find_initial_conflicting_snapshots(repair_diff: PoolList, complete_target: P
     hard_conflicting_datasets = PoolList()
 
     for snapshot in repair_diff.iter_snapshots():
-        if snapshot.snapshot_name.endswith(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX):
+        if snapshot.snapshot_name.endswith(_INITIAL_SNAPSHOT_SUFFIX):
             try:
                 target_dataset = complete_target.get_dataset_by_path(snapshot.dataset_zfs_path)
             except ZfsResolveError:
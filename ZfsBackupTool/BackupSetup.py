@@ -56,6 +56,7 @@ class BackupSetup(object):
         source_pool_view_mapping: Dict[BackupSource, PoolList] = {}
         """Maps a backup source to a logical view of a pool list"""
 
+        backup_snapshot_name_prefix = self.snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR
         for source in self.sources.values():
             pools_view = pools.view()
             source_pool_view_mapping[source] = pools_view
@@ -68,8 +69,7 @@ class BackupSetup(object):
                         continue
 
                     for snapshot_view in dataset_view:
-                        if not snapshot_view.snapshot_name.startswith(
-                                self.snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR):
+                        if not snapshot_view.snapshot_name.startswith(backup_snapshot_name_prefix):
                             dataset_view.remove_snapshot(snapshot_view)
                             continue
 
@@ -80,10 +80,10 @@ class BackupSetup(object):
 
     def filter_by_prefix(self, pools: PoolList) -> PoolList:
         pools_view = pools.view()
+        backup_snapshot_name_prefix = self.snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR
         for dataset in pools_view.iter_datasets():
             for snapshot in dataset:
-                if not snapshot.snapshot_name.startswith(
-                        self.snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR):
+                if not snapshot.snapshot_name.startswith(backup_snapshot_name_prefix):
                     dataset.remove_snapshot(snapshot)
         return pools_view
 
@@ -109,6 +109,7 @@ class BackupSetup(object):
                 for target_path in target_group.target_paths:
                     host_target_path_list[target_group.remote].add(target_path)
 
+        backup_snapshot_name_prefix = self.snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR
         for host, target_paths in host_target_path_list.items():
             shell_command.set_remote_host(host)
 
@@ -124,8 +125,7 @@ class BackupSetup(object):
                     for pool in pools:
                         for dataset in pool:
                             for snapshot in dataset:
-                                if not snapshot.snapshot_name.startswith(
-                                        self.snapshot_prefix + SNAPSHOT_PREFIX_POSTFIX_SEPARATOR):
+                                if not snapshot.snapshot_name.startswith(backup_snapshot_name_prefix):
                                     dataset.remove_snapshot(snapshot)
 
         return host_target_path_pool_mapping
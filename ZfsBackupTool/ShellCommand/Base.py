@@ -1,7 +1,7 @@
 import subprocess
 import threading
 from subprocess import Popen
-from typing import Optional, IO, cast
+from typing import Optional, IO, List, cast
 
 from .SshHost import SshHost
 
@@ -114,6 +114,18 @@ class BaseShellCommand(object):
                     str(sub_process.args)))
         return sub_process
 
+    def _execute_read_lines(self, command: str) -> List[str]:
+        """
+        Executes the command and returns the lines of its stdout.
+        The output is read while the command runs, so large outputs can not block the command on a full pipe.
+        """
+        sub_process = self._execute(command, capture_output=True, no_wait=True)
+        stdout_data, stderr_data = sub_process.communicate()
+        if sub_process.returncode != 0:
+            raise CommandExecutionError(sub_process, "Error executing command: {}\n{}".format(
+                str(sub_process.args), stderr_data.decode('utf-8') if stderr_data else ""))
+        return stdout_data.decode('utf-8').splitlines() if stdout_data else []
+
     @classmethod
     def _get_ssh_command(cls, remote: SshHost):
         command = "ssh -o BatchMode=yes "
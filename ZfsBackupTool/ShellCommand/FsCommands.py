@@ -2,7 +2,7 @@ import shlex
 import sys
 import threading
 from subprocess import Popen
-from typing import List, Tuple, Dict, cast, IO, TypeVar
+from typing import List, Tuple, Dict, Optional, cast, IO, TypeVar
 
 from .Base import BaseShellCommand, CommandExecutionError, PipePrinterThread
 from ..Constants import CALCULATED_CHECKSUM_FILE_POSTFIX
@@ -97,15 +97,62 @@ class FsCommands(BaseShellCommand):
         files: List[str] = []
         directories: List[str] = []
         for line in sub_process.stdout.read().decode('utf-8').splitlines():
-            line = line.strip()
-            if line.endswith('/'):  # directory
-                directories.append(line[:-1])
-            elif line.endswith('*'):  # executable
-                files.append(line[:-1])
-            elif line[-1] not in ['@', '%', '|', '=', '>']:  # not other special files
-                files.append(line)
+            self._add_classified_entry(line.strip(), files, directories)
         return files, directories
 
+    def target_walk_directory(self, path: str) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        Returns the files and directories of the given directory and all of its subdirectories with a single command.
+        The tuples of files and directories are keyed by the directory path relative to the given directory, the
+        given directory itself is keyed by an empty string.
+        """
+        root_path = path.rstrip('/') or '/'
+        # only POSIX find options are used. the root directory is passed to every ls call, so ls always lists more
+        # than one directory and prints a header line for each of them.
+        walk_command = 'find "{}" -type d -exec ls -AF "{}" {{}} +'.format(root_path, root_path)
+        if self.remote:
+            command = self._get_ssh_command(self.remote)
+            command += shlex.quote(walk_command)
+        else:
+            command = walk_command
+        return self._parse_walk_output(root_path, self._execute_read_lines(command))
+
+    @classmethod
+    def _parse_walk_output(cls, root_path: str, lines: List[str]) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        Parses the 'ls -AF' output of multiple directories below the root path.
+        """
+        root_header = root_path + ':'
+        sub_directory_prefix = root_path + '/' if root_path != '/' else '/'
+        directories: Dict[str, Tuple[List[str], List[str]]] = {'': ([], [])}
+        current_directory: Optional[Tuple[List[str], List[str]]] = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                # separator between two directories
+                continue
+            if line == root_header:
+                # the root directory is listed by every ls call, the listing is replaced, not extended
+                current_directory = directories[''] = ([], [])
+            elif line.endswith(':') and line.startswith(sub_directory_prefix):
+                # header of a sub directory, entries never contain the root path
+                current_directory = directories[line[len(sub_directory_prefix):-1]] = ([], [])
+            elif current_directory is not None:
+                cls._add_classified_entry(line, *current_directory)
+        return directories
+
+    @staticmethod
+    def _add_classified_entry(entry: str, files: List[str], directories: List[str]):
+        """
+        Adds an entry of 'ls -F' to the files or directories by its type indicator.
+        """
+        if entry.endswith('/'):  # directory
+            directories.append(entry[:-1])
+        elif entry.endswith('*'):  # executable
+            files.append(entry[:-1])
+        elif entry[-1] not in ['@', '%', '|', '=', '>']:  # not other special files
+            files.append(entry)
+
     def target_read_checksum_from_file(self, path: str) -> str:
         if self.remote:
             command = self._get_ssh_command(self.remote)
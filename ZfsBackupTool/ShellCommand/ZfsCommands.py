@@ -4,7 +4,7 @@ import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from .Base import BaseShellCommand, CommandExecutionError
 from ..Constants import (TARGET_STORAGE_SUBDIRECTORY, BACKUP_FILE_POSTFIX, TARGET_DATASET_REPLACEMENT_POSTFIX,
@@ -58,6 +58,22 @@ class ZfsCommands(BaseShellCommand):
                  datetime.fromtimestamp(int(line.strip().split()[1])))
                 for line in stdout_lines]
 
+    def list_snapshots_with_creation_time_recursive(self, zfs_path: str) -> Dict[str, List[Tuple[str, datetime]]]:
+        """
+        List the snapshots of the given pool or dataset and all of its children with a single zfs call.
+        The snapshot names and creation times are grouped by the zfs path of their dataset.
+        """
+        command = "zfs list -H -p -r -o name,creation -t snapshot"
+        command += ' "{}"'.format(zfs_path)
+        snapshots: Dict[str, List[Tuple[str, datetime]]] = {}
+        for line in self._execute_read_lines(command):
+            # the columns are tab separated, zfs names may contain spaces
+            snapshot_zfs_path, creation_time = line.rstrip('\n').split('\t')
+            dataset_zfs_path, _, snapshot_name = snapshot_zfs_path.partition('@')
+            snapshots.setdefault(dataset_zfs_path, []).append(
+                (snapshot_name, datetime.fromtimestamp(int(creation_time))))
+        return snapshots
+
     def has_dataset(self, dataset: str) -> bool:
         command = "zfs list -H -o name"
         command += ' | grep -q -e "^{}$"'.format(dataset)
@@ -89,6 +105,20 @@ class ZfsCommands(BaseShellCommand):
         stdout_lines = sub_process.stdout.read().decode('utf-8').splitlines() if sub_process.stdout else []
         return int(stdout_lines[0].strip())
 
+    def get_dataset_sizes_recursive(self, zfs_path: str) -> Dict[str, int]:
+        """
+        Get the sizes of the given pool or dataset and all of its children with a single zfs call.
+        The sizes are keyed by the zfs path of the datasets.
+        """
+        command = 'zfs list -p -H -r -o name,refer'
+        command += ' "{}"'.format(zfs_path)
+        dataset_sizes: Dict[str, int] = {}
+        for line in self._execute_read_lines(command):
+            # the columns are tab separated, zfs names may contain spaces
+            dataset_zfs_path, dataset_size = line.rstrip('\n').split('\t')
+            dataset_sizes[dataset_zfs_path] = int(dataset_size)
+        return dataset_sizes
+
     def get_estimated_snapshot_size(self, source_dataset: str, previous_snapshot: Optional[str], next_snapshot: str,
                                     include_intermediate_snapshots: bool = False):
         if previous_snapshot:
@@ -1,16 +1,38 @@
+from __future__ import annotations
+
+import sys
 from datetime import datetime
-from typing import Optional
+from itertools import count
+
+from ZfsBackupTool.Constants import SNAPSHOT_PREFIX_POSTFIX_SEPARATOR, INITIAL_SNAPSHOT_POSTFIX
+
+_INITIAL_SUFFIX = SNAPSHOT_PREFIX_POSTFIX_SEPARATOR + INITIAL_SNAPSHOT_POSTFIX
+_creation_time_generations = count(1)
 
 
 class Snapshot(object):
+    __slots__ = ("pool_name", "dataset_name", "snapshot_name", "dataset_zfs_path", "zfs_path", "_incremental_base",
+                 "_creation_time", "_is_initial", "_prefix", "_index")
+    # changes whenever a creation time is set, datasets re-sort their cached snapshot order when it differs
+    creation_time_generation = 0
+
     def __init__(self, pool_name: str, dataset_name: str, snapshot_name: str):
         self.pool_name = pool_name
         self.dataset_name = dataset_name
         self.snapshot_name = snapshot_name
         self.dataset_zfs_path = "{}/{}".format(pool_name, dataset_name)
-        self.zfs_path = "{}/{}@{}".format(pool_name, dataset_name, snapshot_name)
-        self._incremental_base: Optional['Snapshot'] = None
-        self._creation_time: Optional[datetime] = None
+        # interned, the zfs path is the key of all snapshot lookups
+        self.zfs_path = sys.intern("{}/{}@{}".format(pool_name, dataset_name, snapshot_name))
+        self._incremental_base: 'Snapshot | None' = None
+        self._creation_time: datetime | None = None
+        self._is_initial = snapshot_name.endswith(_INITIAL_SUFFIX)
+        # backup snapshot name components ('<prefix>.<index>', 'initial' is index 0), None for other names
+        self._prefix: str | None = None
+        self._index: int | None = None
+        snapshot_prefix, separator, snapshot_number = snapshot_name.rpartition(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR)
+        if separator and (self._is_initial or snapshot_number.isdecimal()):
+            self._prefix = snapshot_prefix
+            self._index = 0 if self._is_initial else int(snapshot_number)
 
     def __str__(self):
         if self._incremental_base:
@@ -36,25 +58,32 @@ class Snapshot(object):
             snapshot_copy._creation_time = self._creation_time
         return snapshot_copy
 
-    def prefixed_view(self, prefix: str, deshift: bool = False) -> 'Snapshot':
+    def prefixed_copy(self, prefix: str, deshift: bool = False) -> 'Snapshot':
         """
-        Creates a full copy of the current DataSet instance including all sub-references.
-        Sub-references are also copied and not just referenced.
-        All zfs paths are prefixed with the given prefix. This can be used to 'shift' the snapshot to a different
-        location in the zfs hierarchy.
+        Same as copy(), but the zfs path is prefixed with the given prefix.
+        The incremental base is not set in the new instance.
         """
         if deshift:
             prefixed_zfs_path = self.dataset_zfs_path.replace(prefix, '', 1)
         else:
             prefixed_zfs_path = prefix + self.dataset_zfs_path
-        pool_name = prefixed_zfs_path.split("/", 1)[0]
-        dataset_name = prefixed_zfs_path.split("/", 1)[1]
+        pool_name, _, dataset_name = prefixed_zfs_path.partition("/")
 
-        view_snapshot = Snapshot(pool_name, dataset_name, self.snapshot_name)
+        snapshot_copy = Snapshot(pool_name, dataset_name, self.snapshot_name)
+        if self._creation_time:
+            snapshot_copy._creation_time = self._creation_time
+        return snapshot_copy
+
+    def prefixed_view(self, prefix: str, deshift: bool = False) -> 'Snapshot':
+        """
+        Creates a full copy of the current DataSet instance including all sub-references.
+        Sub-references are also copied and not just referenced.
+        All zfs paths are prefixed with the given prefix. This can be used to 'shift' the snapshot to a different
+        location in the zfs hierarchy.
+        """
+        view_snapshot = self.prefixed_copy(prefix, deshift)
         if self._incremental_base:
             view_snapshot._incremental_base = self._incremental_base.prefixed_view(prefix, deshift)
-        if self._creation_time:
-            view_snapshot._creation_time = self._creation_time
         return view_snapshot
 
     def view(self):
@@ -67,7 +96,7 @@ class Snapshot(object):
     def print(self, with_incremental_base: bool = True):
         if self.has_incremental_base() and with_incremental_base:
             print("    Snapshot: {} ({}) -incr-> {}".format(self.snapshot_name, self.zfs_path,
-                                                       self._incremental_base.snapshot_name))
+                                                       self.get_incremental_base_unchecked().snapshot_name))
         else:
             print("    Snapshot: {} ({})".format(self.snapshot_name, self.zfs_path))
 
@@ -88,11 +117,13 @@ class Snapshot(object):
 
         new_merged_snapshot = cls(pool_name, dataset_name, snapshot_name)
 
-        incremental_bases = [snapshot.get_incremental_base() for snapshot in others if snapshot.has_incremental_base()]
+        incremental_bases = [snapshot.get_incremental_base_unchecked() for snapshot in others
+                             if snapshot.has_incremental_base()]
         if incremental_bases:
             new_merged_snapshot.set_incremental_base(cls.merge(pool_name, dataset_name, *incremental_bases))
 
-        creation_times = [snapshot.get_creation_time() for snapshot in others if snapshot.has_creation_time()]
+        creation_times = [snapshot.get_creation_time_unchecked() for snapshot in others
+                          if snapshot.has_creation_time()]
         if creation_times:
             new_merged_snapshot.set_creation_time(min(creation_times))
         return new_merged_snapshot
@@ -100,21 +131,37 @@ class Snapshot(object):
     def has_incremental_base(self) -> bool:
         return self._incremental_base is not None
 
-    def set_incremental_base(self, base: Optional['Snapshot']):
+    def set_incremental_base(self, base: 'Snapshot | None'):
         self._incremental_base = base
 
     def get_incremental_base(self) -> 'Snapshot':
-        if not self._incremental_base:
+        if self._incremental_base is None:
             raise ValueError("Snapshot has no incremental base")
         return self._incremental_base
 
+    def get_incremental_base_unchecked(self) -> 'Snapshot':
+        """
+        Same as get_incremental_base(), but without the presence check.
+        Only use this after has_incremental_base() returned True.
+        """
+        return self._incremental_base  # type: ignore
+
     def has_creation_time(self) -> bool:
         return self._creation_time is not None
 
     def set_creation_time(self, creation_time: datetime):
         self._creation_time = creation_time
+        Snapshot.creation_time_generation = next(_creation_time_generations)
 
     def get_creation_time(self) -> datetime:
-        if not self._creation_time:
+        if self._creation_time is None:
             raise ValueError("Snapshot has no creation time")
         return self._creation_time
+
+    def get_creation_time_unchecked(self) -> datetime:
+        """
+        Same as get_creation_time(), but without the presence check.
+        Only use this after has_creation_time() returned True.
+        """
+        return self._creation_time  # type: ignore
+
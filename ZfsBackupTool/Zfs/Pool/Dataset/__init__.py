@@ -1,40 +1,72 @@
-from typing import Dict, Iterator, List, Iterable, Optional, Tuple
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
 
 from ZfsBackupTool.Constants import SNAPSHOT_PREFIX_POSTFIX_SEPARATOR, INITIAL_SNAPSHOT_POSTFIX
 from .Snapshot import Snapshot
 from ...errors import ZfsResolveError, ZfsAddError, ZfsParseError
 
+_creation_time_key = attrgetter("_creation_time")
+_index_key = attrgetter("_index")
+
 
 class DataSet(object):
+    __slots__ = ("pool_name", "dataset_name", "zfs_path", "_snapshot_prefix", "snapshots", "_dataset_size",
+                 "_sorted_cache", "_sorted_generation")
+
     def __init__(self, pool_name: str, dataset_name):
         self.pool_name = pool_name
         self.dataset_name = dataset_name
-        self.zfs_path = "{}/{}".format(pool_name, dataset_name)
-        self.snapshots: Dict[str, Snapshot] = {}
-        self._dataset_size: Optional[int] = None
+        self.zfs_path = f"{pool_name}/{dataset_name}"
+        # zfs path prefix shared by all snapshots of this dataset
+        self._snapshot_prefix = self.zfs_path + "@"
+        self.snapshots: dict[str, Snapshot] = {}
+        self._dataset_size: int | None = None
+        # sorted snapshot order, invalidated whenever the snapshots or a creation time change
+        self._sorted_cache: list[Snapshot] | None = None
+        self._sorted_generation = 0
 
     def __str__(self):
         return "DataSet({})".format(self.zfs_path)
 
     def __iter__(self) -> Iterator[Snapshot]:
-        for snapshot in self.sort_snapshots(self.snapshots.values()):
-            yield snapshot
+        # the cached list is replaced, not modified, on changes. removing snapshots while iterating is safe.
+        return iter(self.sorted_snapshots())
+
+    def sorted_snapshots(self) -> list[Snapshot]:
+        """
+        Returns the snapshots in sorted order. The list is cached until the snapshots or any creation time change
+        and must not be modified.
+        """
+        # snapshots do not know their dataset, a creation time change is detected by the global generation
+        creation_time_generation = Snapshot.creation_time_generation
+        if self._sorted_cache is None or self._sorted_generation != creation_time_generation:
+            self._sorted_generation = creation_time_generation
+            self._sorted_cache = self.sort_snapshots(self.snapshots.values())
+        return self._sorted_cache
 
     def __contains__(self, item: Snapshot):
         return item.zfs_path in self.snapshots
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, DataSet):
             return False
+        # check the cheap attributes first
+        if self.zfs_path != other.zfs_path or len(self.snapshots) != len(other.snapshots):
+            return False
         # our snapshots and the other snapshots must be the same
-        if set(self.snapshots.keys()) != set(other.snapshots.keys()):
+        if self.snapshots.keys() != other.snapshots.keys():
             return False
-        # the snapshots itself must also be the same
-        for snapshot in self:
-            if snapshot != other.snapshots[snapshot.zfs_path]:
+        # the snapshots itself must also be the same, order does not matter here
+        other_snapshots = other.snapshots
+        for snapshot_path, snapshot in self.snapshots.items():
+            if snapshot != other_snapshots[snapshot_path]:
                 return False
-        # finally check the dataset paths and other attributes
-        return self.zfs_path == other.zfs_path
+        return True
 
     def __hash__(self):
         return hash(self.zfs_path)
@@ -62,6 +94,14 @@ class DataSet(object):
             new_dataset.dataset_size = self._dataset_size
         return new_dataset
 
+    @classmethod
+    def _from_zfs_path(cls, zfs_path: str) -> 'DataSet':
+        """
+        Creates an empty DataSet from a '<pool>/<dataset>' zfs path.
+        """
+        pool_name, _, dataset_name = zfs_path.partition("/")
+        return cls(pool_name, dataset_name)
+
     def prefixed_view(self, prefix: str, deshift: bool = False) -> 'DataSet':
         """
         Creates a full copy of the current DataSet instance including all sub-references.
@@ -73,37 +113,24 @@ class DataSet(object):
             prefixed_zfs_path = self.zfs_path.replace(prefix, '', 1)
         else:
             prefixed_zfs_path = prefix + self.zfs_path
-        pool_name = prefixed_zfs_path.split("/", 1)[0]
-        dataset_name = prefixed_zfs_path.split("/", 1)[1]
 
-        view_dataset = DataSet(pool_name, dataset_name)
-        for snapshot in self.snapshots.values():
-            view_dataset.add_snapshot(snapshot.prefixed_view(prefix, deshift))
+        view_dataset = DataSet._from_zfs_path(prefixed_zfs_path)
+        # copy the snapshots without their incremental bases, keyed by the path of their source snapshot
+        snapshot_copies = {snapshot_path: snapshot.prefixed_copy(prefix, deshift)
+                           for snapshot_path, snapshot in self.snapshots.items()}
 
-        # but we now have to fix the incremental refs, as they are also cloned via .view()
-        # this results in completely new objects, but we want to keep the references to the snapshot instances under
-        # the new dataset
-        # the snapshot.view() cloning operates correctly, but for datasets, the incremental refs are not correct.
-        # it is expected to have the incremental refs pointing to the same snapshot objects as in the original dataset
-
-        # iterate SORTED snapshots to ensure incremental refs are set correctly from the beginning
-        for snapshot in self.sort_snapshots(view_dataset):
+        # the incremental refs point to the snapshot copies of the new dataset, as in the original dataset.
+        # if the incremental base is not part of this dataset, only a pseudo snapshot is used as incremental base.
+        for snapshot_path, snapshot in self.snapshots.items():
             if snapshot.has_incremental_base():
-                incremental_base = snapshot.get_incremental_base()
-                # we have to resolve the incremental base snapshot from the original dataset
-                # and set it as the incremental base for the current snapshot
-                try:
-                    dataset_shared_incremental_base = view_dataset.snapshots[incremental_base.zfs_path]
-                except KeyError:
-                    # the incremental base is not part of the view. This can happen, if the incremental base was
-                    # filtered out previously. In this case, we have to create a pseudo incremental base snapshot
-                    # with the same name as the original incremental base snapshot.
-                    # with .view() this can cause a longer incremental chain. this is skipped and only a pseudo snapshot
-                    # is used as incremental base (.copy()).
-                    snapshot.set_incremental_base(incremental_base.copy())
-                    continue
-                else:
-                    snapshot.set_incremental_base(dataset_shared_incremental_base)
+                incremental_base = snapshot.get_incremental_base_unchecked()
+                dataset_shared_incremental_base = snapshot_copies.get(incremental_base.zfs_path)
+                if dataset_shared_incremental_base is None:
+                    dataset_shared_incremental_base = incremental_base.prefixed_copy(prefix, deshift)
+                snapshot_copies[snapshot_path].set_incremental_base(dataset_shared_incremental_base)
+
+        # all snapshots are shifted alike, their paths stay unique
+        view_dataset.snapshots = {snapshot.zfs_path: snapshot for snapshot in snapshot_copies.values()}
 
         if self._dataset_size is not None:
             view_dataset.dataset_size = self._dataset_size
@@ -114,26 +141,50 @@ class DataSet(object):
         Creates a full copy of the current DataSet instance including all sub-references.
         Sub-references are also copied and not just referenced.
         """
-        return self.prefixed_view('')
+        # no shifting needed, the snapshots are copied once and linked against each other
+        return self._partial_view(self.snapshots.values())
+
+    def _partial_view(self, snapshots: Iterable[Snapshot]) -> 'DataSet':
+        """
+        Creates a view of the current DataSet instance, which only contains views of the given snapshots.
+        Incremental refs of the snapshots are resolved to the snapshot instances of the new dataset.
+        """
+        partial_view = self.copy()
+        snapshots = list(snapshots)
+        # the given snapshots are taken from a dataset and therefore unique, no add_snapshot checks are needed.
+        # the snapshots are copied without their incremental bases, a snapshot.view() would clone the whole
+        # incremental chain of every snapshot again.
+        partial_view_snapshots = {snapshot.zfs_path: snapshot.copy() for snapshot in snapshots}
+        partial_view.snapshots = partial_view_snapshots
+        for snapshot in snapshots:
+            if snapshot.has_incremental_base():
+                incremental_base = snapshot.get_incremental_base_unchecked()
+                # link against the copy in the new dataset, or a pseudo snapshot if the base is not part of it
+                dataset_shared_incremental_base = partial_view_snapshots.get(incremental_base.zfs_path)
+                if dataset_shared_incremental_base is None:
+                    dataset_shared_incremental_base = incremental_base.copy()
+                partial_view_snapshots[snapshot.zfs_path].set_incremental_base(dataset_shared_incremental_base)
+        return partial_view
 
     def resolve_snapshot_name(self, snapshot_name: str) -> str:
-        return "{}@{}".format(self.zfs_path, snapshot_name)
+        return self._snapshot_prefix + snapshot_name
 
     def add_snapshot(self, snapshot: Snapshot):
         if snapshot.zfs_path in self.snapshots:
             raise ZfsAddError(
                 "Dataset '{}' already added to the pool '{}'".format(snapshot.snapshot_name, self.zfs_path))
         self.snapshots[snapshot.zfs_path] = snapshot
+        self._sorted_cache = None
 
     def remove_snapshot(self, snapshot: Snapshot) -> Snapshot:
         if snapshot.zfs_path not in self.snapshots:
             raise ValueError(
                 "Dataset '{}' not found in the pool '{}'".format(snapshot.snapshot_name, self.zfs_path))
+        self._sorted_cache = None
         return self.snapshots.pop(snapshot.zfs_path)
 
     def iter_snapshots(self) -> Iterator[Snapshot]:
-        for snapshot in self:
-            yield snapshot
+        return iter(self)
 
     def resolve_zfs_path(self, zfs_path: str) -> Snapshot:
         """
@@ -141,9 +192,10 @@ class DataSet(object):
 
         :raises ZfsResolveError: If the ZFS path is not found in the dataset.
         """
-        if zfs_path.startswith(self.zfs_path):
-            snapshot_name = zfs_path.split("@")[1]
-            return self.snapshots[snapshot_name]
+        # snapshots are keyed by their full zfs path, only paths below this dataset can be found
+        snapshot = self.snapshots.get(zfs_path)
+        if snapshot is not None:
+            return snapshot
         raise ZfsResolveError("Snapshot '{}' not found in the dataset '{}'".format(zfs_path, self.zfs_path))
 
     def get_snapshot_by_name(self, snapshot_name: str) -> Snapshot:
@@ -164,44 +216,41 @@ class DataSet(object):
 
     @classmethod
     def merge(cls, pool_name: str, *others: 'DataSet'):
-        # build a set with all datasets names
-        dataset_names = set(dataset.dataset_name for dataset in others)
-        # verify all datasets have the same name
-        if len(dataset_names) > 1:
-            raise ValueError("Datasets must have the same name to be merged")
-
-        dataset_name = dataset_names.pop()
+        if len(others) == 1 and others[0].pool_name == pool_name:
+            # nothing to merge, a view is equal to the merge result
+            return others[0].view()
 
+        dataset_name = others[0].dataset_name
+        first_dataset_snapshots = others[0].snapshots
         new_merged_dataset = cls(pool_name, dataset_name)
-        all_snapshots: Dict[str, List[Snapshot]] = {}
+        all_snapshots: defaultdict[str, list[Snapshot]] = defaultdict(list)
+        # if all given datasets have the same snapshots and the same size, the merged dataset will also have the same
+        # size, but this also only works if the dataset sizes are set
+        merged_dataset_size = others[0]._dataset_size
 
-        # fill the all_snapshots dict with all snapshots from all datasets
+        # fill the all_snapshots dict with all snapshots from all datasets, check the names and sizes in the same pass
         for dataset in others:
-            for snapshot in dataset.snapshots.values():
-                if snapshot.zfs_path in all_snapshots:
-                    all_snapshots[snapshot.zfs_path].append(snapshot)
-                else:
-                    all_snapshots[snapshot.zfs_path] = [snapshot]
+            # verify all datasets have the same name
+            if dataset.dataset_name != dataset_name:
+                raise ValueError("Datasets must have the same name to be merged")
+            dataset_snapshots = dataset.snapshots
+            for snapshot_path, snapshot in dataset_snapshots.items():
+                all_snapshots[snapshot_path].append(snapshot)
+            if merged_dataset_size is not None and (dataset._dataset_size != merged_dataset_size
+                                                    or dataset_snapshots.keys() != first_dataset_snapshots.keys()):
+                merged_dataset_size = None
 
         for snapshot_path, mergable_snapshots in all_snapshots.items():
             new_merged_snapshot = Snapshot.merge(pool_name, dataset_name, *mergable_snapshots)
             new_merged_dataset.add_snapshot(new_merged_snapshot)
 
-        # if all given datasets have the same snapshots and the same size, the merged dataset will also have the same
-        # size, but this also only works if the dataset sizes are set
-
-        if all(dataset.has_dataset_size() for dataset in others):
-            # all datasets must have the same snapshots
-            new_merged_dataset_snapshot_names = set(new_merged_dataset.snapshots.keys())
-            if all(set(dataset.snapshots.keys()) == new_merged_dataset_snapshot_names for dataset in others):
-                dataset_sizes = [dataset.dataset_size for dataset in others]
-                if len(set(dataset_sizes)) == 1:
-                    new_merged_dataset.dataset_size = dataset_sizes[0]
+        if merged_dataset_size is not None:
+            new_merged_dataset.dataset_size = merged_dataset_size
 
         return new_merged_dataset
 
     @classmethod
-    def parse_backup_snapshot(cls, snapshot_name: str) -> Tuple[str, int]:
+    def parse_backup_snapshot(cls, snapshot_name: str) -> tuple[str, int]:
         """
         Parse a backup snapshot name into its components.
 
@@ -209,9 +258,9 @@ class DataSet(object):
         :returns: A tuple containing the snapshot prefix and the snapshot sequence number.
         :raises ZfsParseError: If the snapshot name is invalid.
         """
-        if SNAPSHOT_PREFIX_POSTFIX_SEPARATOR not in snapshot_name:
+        snapshot_prefix, separator, snapshot_number = snapshot_name.rpartition(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR)
+        if not separator:
             raise ZfsParseError("Invalid snapshot name: {}".format(snapshot_name))
-        snapshot_prefix, snapshot_number = snapshot_name.rsplit(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR, 1)
         if snapshot_number == INITIAL_SNAPSHOT_POSTFIX:
             return snapshot_prefix, 0
         if not snapshot_number.isnumeric():
@@ -219,22 +268,14 @@ class DataSet(object):
         return snapshot_prefix, int(snapshot_number)
 
     @classmethod
-    def sort_snapshots(cls, snapshots: Iterable[Snapshot]) -> List[Snapshot]:
+    def sort_snapshots(cls, snapshots: Iterable[Snapshot]) -> list[Snapshot]:
         snapshots = list(snapshots)
-        # if snapshots have a creation time, sort by creation time
-        if all(snapshot.has_creation_time() for snapshot in snapshots):
-            return sorted(snapshots, key=lambda s: s.get_creation_time())
+        # if snapshots have a creation time, sort by creation time.
+        # the key reads the creation time attribute directly, no getter call per snapshot.
+        if all(snapshot._creation_time is not None for snapshot in snapshots):
+            return sorted(snapshots, key=_creation_time_key)
         # otherwise sort by snapshot name, but initial snapshots first
-        initial_snapshots = sorted([s for s in snapshots
-                                    if s.snapshot_name.endswith(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR
-                                                                + INITIAL_SNAPSHOT_POSTFIX)],
-                                   key=lambda s: s.zfs_path)
-        non_initial_snapshots = sorted([s for s in snapshots
-                                        if not s.snapshot_name.endswith(SNAPSHOT_PREFIX_POSTFIX_SEPARATOR
-                                                                        + INITIAL_SNAPSHOT_POSTFIX)],
-                                       key=lambda s: s.zfs_path)
-
-        return initial_snapshots + non_initial_snapshots
+        return sorted(snapshots, key=lambda s: (not s._is_initial, s.zfs_path))
 
     def difference(self, *other_datasets: 'DataSet') -> 'DataSet':
         """
@@ -242,16 +283,12 @@ class DataSet(object):
 
         (i.e. all snapshots that are in this dataset but not the others.)
         """
-        base_dataset_snapshots = set(self.snapshots.keys())
-
-        difference_snapshots = base_dataset_snapshots.difference(*(dataset.snapshots.keys()
-                                                                   for dataset in other_datasets))
+        other_snapshots = [dataset.snapshots for dataset in other_datasets]
 
-        difference_dataset = self.view()
-        for snapshot in difference_dataset:
-            if snapshot.zfs_path not in difference_snapshots:
-                difference_dataset.remove_snapshot(snapshot)
-        return difference_dataset
+        # only clone the snapshots which are part of the result, membership is checked against the other dicts
+        # directly, no key sets are built
+        return self._partial_view(snapshot for snapshot_path, snapshot in self.snapshots.items()
+                                  if not any(snapshot_path in snapshots for snapshots in other_snapshots))
 
     def intersection(self, *other_datasets: 'DataSet') -> 'DataSet':
         """
@@ -259,19 +296,17 @@ class DataSet(object):
 
         (i. e. all snapshots that are in both datasets.)
         """
-        base_dataset_snapshots = set(self.snapshots.keys())
+        # check the smallest datasets first, they are the most likely to reject a snapshot
+        other_snapshots = sorted((dataset.snapshots for dataset in other_datasets), key=len)
 
-        intersection_snapshots = base_dataset_snapshots.intersection(*(dataset.snapshots.keys()
-                                                                       for dataset in other_datasets))
-
-        difference_dataset = self.view()
-        for snapshot in difference_dataset:
-            if snapshot.zfs_path not in intersection_snapshots:
-                difference_dataset.remove_snapshot(snapshot)
-        return difference_dataset
+        # only clone the snapshots which are part of the result, membership is checked against the other dicts
+        # directly, no key sets are built
+        return self._partial_view(snapshot for snapshot_path, snapshot in self.snapshots.items()
+                                  if all(snapshot_path in snapshots for snapshots in other_snapshots))
 
     def has_incremental_snapshot_refs(self) -> bool:
-        return any(snapshot.has_incremental_base() for snapshot in self.snapshots.values())
+        # not cached, the refs are set on the snapshots directly and the dataset is not notified
+        return any(map(Snapshot.has_incremental_base, self.snapshots.values()))
 
     def has_snapshots(self):
         return len(self.snapshots) > 0
@@ -280,9 +315,9 @@ class DataSet(object):
         """
         Get a dataset containing only the snapshots that are incremental children of the given parent snapshot.
 
-        This method creates a view of the current dataset and removes all snapshots that are not incremental children
-        of the specified parent snapshot. The resulting dataset will contain the parent snapshot and all snapshots
-        that follow it in the incremental chain.
+        This method creates a view of the current dataset, which only contains the snapshots that are incremental
+        children of the specified parent snapshot. The resulting dataset will contain all snapshots that follow the
+        parent snapshot in the incremental chain, the parent snapshot itself is not included.
 
         Args:
             parent (Snapshot): The parent snapshot from which to start the incremental chain.
@@ -290,63 +325,58 @@ class DataSet(object):
         Returns:
             DataSet: A new dataset containing only the snapshots that are incremental children of the parent snapshot.
         """
-        thinned_out_view = self.view()
-        # merge parent into the view, it could be missing and would complete the logical chain
-        if parent.zfs_path not in thinned_out_view.snapshots:
-            thinned_out_view.add_snapshot(parent.view())
+        if parent.zfs_path in self.snapshots:
+            children_source = self
+        else:
+            # merge parent into a view, it is missing and would complete the logical chain
+            children_source = self.view()
+            children_source.add_snapshot(parent.view())
             # build up the incremental chain
-            thinned_out_view.build_incremental_snapshot_refs()
+            children_source.build_incremental_snapshot_refs()
 
-        # remove all snapshots that are not incremental children of the parent snapshot
-        for snapshot in list(thinned_out_view.iter_snapshots()):
-            thinned_out_view.remove_snapshot(snapshot)
-            if snapshot == parent:
-                break
-        return thinned_out_view
+        # only clone the snapshots after the parent snapshot
+        sorted_snapshots = children_source.sorted_snapshots()
+        parent_index = sorted_snapshots.index(parent)
+        return children_source._partial_view(sorted_snapshots[parent_index + 1:])
 
     def build_incremental_snapshot_refs(self) -> None:
         """
         Build incremental snapshot references for all snapshots.
         """
-        sorted_snapshots = self.sort_snapshots(self.snapshots.values())
-        found_prefixes = set()
-        for snapshot in sorted_snapshots:
-            try:
-                snapshot_prefix, _ = self.parse_backup_snapshot(snapshot.snapshot_name)
-            except ZfsParseError:
+        # group the snapshots by their prefix, the name components are parsed by the snapshots already
+        prefix_groups: dict[str, list[Snapshot]] = {}
+        for snapshot in self.snapshots.values():
+            if snapshot._prefix is None:
+                # ignore snapshots that are not in the correct format
                 continue
-            found_prefixes.add(snapshot_prefix)
-
-        for found_prefix in found_prefixes:
-            incremental_base = None
-            for index, snapshot in enumerate(sorted_snapshots):
-                try:
-                    snapshot_prefix, snapshot_index = self.parse_backup_snapshot(snapshot.snapshot_name)
-                except ZfsParseError:
+            prefix_groups.setdefault(snapshot._prefix, []).append(snapshot)
+
+        for prefix_group in prefix_groups.values():
+            # only the order inside a prefix group matters, which is given by the snapshot index
+            prefix_group.sort(key=_index_key)
+            prefix_group_iter = iter(prefix_group)
+            incremental_base = next(prefix_group_iter)
+            for snapshot in prefix_group_iter:
+                # verify incremental base +1 is equal to our current snapshot index.
+                # after a gap, the base stays the same, no later snapshot of the group is linked.
+                if incremental_base._index + 1 != snapshot._index:
                     continue
-                if snapshot_prefix == found_prefix:
-                    if incremental_base:
-                        # verify incremental base +1 is equal to our current snapshot index
-                        _, incremental_base_index = self.parse_backup_snapshot(incremental_base.snapshot_name)
-                        if incremental_base_index + 1 != snapshot_index:
-                            continue
-                        snapshot.set_incremental_base(incremental_base)
-                    incremental_base = snapshot
+                snapshot.set_incremental_base(incremental_base)
+                incremental_base = snapshot
 
     def drop_snapshots(self):
         self.snapshots.clear()
+        self._sorted_cache = None
 
-    def filter_include_by_zfs_path_prefix(self, zfs_path_prefix: Optional[str]) -> "DataSet":
+    def filter_include_by_zfs_path_prefix(self, zfs_path_prefix: str | None) -> "DataSet":
         """
         Filter out all elements in the pool, which do not match the given zfs path prefix.
         """
         if zfs_path_prefix is not None and "@" in zfs_path_prefix:
             new_dataset = self.copy()
-            for snapshot in self.snapshots.values():
-                if zfs_path_prefix is not None and not snapshot.zfs_path.startswith(zfs_path_prefix):
-                    continue
-                snapshot_view = snapshot.view()
-                new_dataset.add_snapshot(snapshot_view)
+            # the snapshot paths are unique in this dataset, the views can be stored without the add_snapshot checks
+            new_dataset.snapshots = {snapshot_path: snapshot.view() for snapshot_path, snapshot in self.snapshots.items()
+                                     if snapshot_path.startswith(zfs_path_prefix)}
         else:
             new_dataset = self.view()
 
@@ -358,16 +388,9 @@ class DataSet(object):
         """
         if not snapshot.dataset_zfs_path == self.zfs_path:
             raise ValueError("Snapshot does not belong to this dataset")
-        new_dataset = self.view()
         filter_snapshot_prefix, filter_snapshot_index = self.parse_backup_snapshot(snapshot.snapshot_name)
-        for snapshot in list(new_dataset.iter_snapshots()):
-            try:
-                snapshot_prefix, snapshot_index = self.parse_backup_snapshot(snapshot.snapshot_name)
-            except ZfsParseError:
-                # ignore snapshots that are not in the correct format
-                continue
-            if snapshot_prefix != filter_snapshot_prefix:
-                continue
-            if snapshot_index < filter_snapshot_index:
-                new_dataset.remove_snapshot(snapshot)
-        return new_dataset
+        # keep snapshots that are not in the correct format or belong to another prefix.
+        # only the kept snapshots are cloned.
+        return self._partial_view(dataset_snapshot for dataset_snapshot in self.snapshots.values()
+                                  if dataset_snapshot._prefix != filter_snapshot_prefix
+                                  or dataset_snapshot._index >= filter_snapshot_index)  # type: ignore
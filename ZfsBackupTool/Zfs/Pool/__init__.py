@@ -1,4 +1,8 @@
-from typing import Dict, List, Iterator, Iterable, Union, Optional
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import chain
 
 from .Dataset import DataSet
 from .Dataset.Snapshot import Snapshot
@@ -6,33 +10,51 @@ from ..errors import ZfsResolveError, ZfsAddError, ZfsDeshiftError
 
 
 class Pool(object):
+    __slots__ = ("pool_name", "zfs_path", "_pool_prefix", "datasets", "_sorted_cache")
+
     def __init__(self, pool_name: str):
         self.pool_name = pool_name
         self.zfs_path = pool_name
-        self.datasets: Dict[str, DataSet] = {}
+        self._pool_prefix = pool_name + "/"
+        self.datasets: dict[str, DataSet] = {}
+        # datasets sorted by their zfs path, invalidated whenever the datasets change
+        self._sorted_cache: list[DataSet] | None = None
 
     def __str__(self):
         return "Pool({})".format(self.pool_name)
 
     def __iter__(self) -> Iterator[DataSet]:
-        for dataset_name in sorted(self.datasets.keys()):
-            yield self.datasets[dataset_name]
+        # the cached list is replaced, not modified, on changes. removing datasets while iterating is safe.
+        return iter(self._get_sorted())
+
+    def _get_sorted(self) -> list[DataSet]:
+        """
+        Returns the cached sorted dataset list. The returned list must not be modified.
+        """
+        if self._sorted_cache is None:
+            self._sorted_cache = [self.datasets[dataset_path] for dataset_path in sorted(self.datasets.keys())]
+        return self._sorted_cache
 
     def __contains__(self, item: DataSet):
         return item.zfs_path in self.datasets
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Pool):
             return False
+        # check the pool names and other attributes first, they are cheap
+        if self.pool_name != other.pool_name or len(self.datasets) != len(other.datasets):
+            return False
         # our datasets and the other datasets must be the same
-        if set(self.datasets.keys()) != set(other.datasets.keys()):
+        if self.datasets.keys() != other.datasets.keys():
             return False
-        # the datasets itself must also be the same
-        for dataset in self:
-            if dataset != other.datasets[dataset.zfs_path]:
+        # the datasets itself must also be the same, order does not matter here
+        other_datasets = other.datasets
+        for dataset_path, dataset in self.datasets.items():
+            if dataset != other_datasets[dataset_path]:
                 return False
-        # finally check the pool names and other attributes
-        return self.pool_name == other.pool_name
+        return True
 
     def copy(self):
         """
@@ -66,10 +88,13 @@ class Pool(object):
         Creates a full copy of the current Pool instance including all sub-references.
         Sub-references are also copied and not just referenced.
         """
-        return self.prefixed_view('')
+        # no shifting needed, the dataset paths stay the same and unique
+        view_pool = self.copy()
+        view_pool.datasets = {dataset_path: dataset.view() for dataset_path, dataset in self.datasets.items()}
+        return view_pool
 
     def resolve_dataset_name(self, dataset_name: str) -> str:
-        return "{}/{}".format(self.pool_name, dataset_name)
+        return self._pool_prefix + dataset_name
 
     def add_dataset(self, dataset: DataSet):
         if dataset.zfs_path in self.datasets:
@@ -78,22 +103,21 @@ class Pool(object):
             raise ZfsAddError("Dataset '{}' must have the same pool name as the pool '{}'".format(dataset.zfs_path,
                                                                                                   self.pool_name))
         self.datasets[dataset.zfs_path] = dataset
+        self._sorted_cache = None
 
     def remove_dataset(self, dataset: DataSet):
         if dataset.zfs_path not in self.datasets:
             raise ValueError("Dataset '{}' not found in the pool '{}'".format(dataset.zfs_path, self.pool_name))
         self.datasets.pop(dataset.zfs_path)
+        self._sorted_cache = None
 
     def iter_datasets(self) -> Iterable[DataSet]:
-        for dataset in self:
-            yield dataset
+        return iter(self)
 
     def iter_snapshots(self) -> Iterable[Snapshot]:
-        for dataset in self:
-            for snapshot in dataset:
-                yield snapshot
+        return chain.from_iterable(self)
 
-    def resolve_zfs_path(self, zfs_path: str) -> Union[DataSet, Snapshot]:
+    def resolve_zfs_path(self, zfs_path: str) -> DataSet | Snapshot:
         """
         Resolve a ZFS path to a dataset or snapshot object.
 
@@ -101,7 +125,7 @@ class Pool(object):
         """
         if '@' in zfs_path:
             # resolve snapshot
-            dataset_path, _ = zfs_path.split("@", 1)
+            dataset_path = zfs_path.partition("@")[0]
             if dataset_path in self.datasets:
                 return self.datasets[dataset_path].resolve_zfs_path(zfs_path)
         else:
@@ -121,27 +145,29 @@ class Pool(object):
 
     @classmethod
     def merge(cls, *others: 'Pool'):
-        # build a set with all pools names
-        pool_names = set(pool.pool_name for pool in others)
-        # verify all pools have the same name
-        if len(pool_names) > 1:
-            raise ValueError("Pools must have the same name to be merged")
+        if len(others) == 1:
+            # nothing to merge, a view is equal to the merge result
+            return others[0].view()
 
-        pool_name = pool_names.pop()
+        pool_name = others[0].pool_name
 
         new_merged_pool = cls(pool_name)
-        all_datasets: Dict[str, List[DataSet]] = {}
+        all_datasets: defaultdict[str, list[DataSet]] = defaultdict(list)
 
         # fill the all_datasets dict with all datasets from all pools
         for pool in others:
-            for dataset in pool.datasets.values():
-                if dataset.zfs_path in all_datasets:
-                    all_datasets[dataset.zfs_path].append(dataset)
-                else:
-                    all_datasets[dataset.zfs_path] = [dataset]
+            # verify all pools have the same name
+            if pool.pool_name != pool_name:
+                raise ValueError("Pools must have the same name to be merged")
+            for dataset_path, dataset in pool.datasets.items():
+                all_datasets[dataset_path].append(dataset)
 
         for dataset_path, mergable_datasets in all_datasets.items():
-            new_merged_dataset = DataSet.merge(pool_name, *mergable_datasets)
+            if len(mergable_datasets) == 1:
+                # dataset only exists in one pool, a view is equal to the merge result
+                new_merged_dataset = mergable_datasets[0].view()
+            else:
+                new_merged_dataset = DataSet.merge(pool_name, *mergable_datasets)
             new_merged_pool.add_dataset(new_merged_dataset)
 
         return new_merged_pool
@@ -152,23 +178,28 @@ class Pool(object):
 
         (i.e. all datasets and snapshots that are in this pool but not the others.)
         """
-        base_pool_datasets = set(self.datasets.keys())
-
-        difference_datasets = base_pool_datasets.difference(*(pool.datasets.keys() for pool in other_pools))
-
-        difference_pool = self.view()
-        for dataset in list(difference_pool.datasets.values()):
-            if dataset.zfs_path not in difference_datasets:
-                # no difference for this dataset -> removable, but check snapshots
-                difference_dataset = dataset.difference(*(pool.datasets[dataset.zfs_path]
-                                                          for pool in other_pools
-                                                          if dataset.zfs_path in pool.datasets))
-                if difference_dataset.snapshots:
-                    # replace the dataset with the difference dataset, which contains the difference snapshots
-                    difference_pool.remove_dataset(dataset)
-                    difference_pool.add_dataset(difference_dataset)
-                else:
-                    difference_pool.remove_dataset(dataset)
+        # collect the datasets of the other pools by their path once
+        other_datasets_by_path: dict[str, list[DataSet]] = {}
+        for pool in other_pools:
+            for dataset_path, dataset in pool.datasets.items():
+                other_datasets_by_path.setdefault(dataset_path, []).append(dataset)
+
+        # only the datasets which are part of the result are cloned. the dataset paths are unique and belong to
+        # this pool, the checks of add_dataset are not needed.
+        difference_datasets: dict[str, DataSet] = {}
+        for dataset_path, dataset in self.datasets.items():
+            other_datasets = other_datasets_by_path.get(dataset_path)
+            if other_datasets is None:
+                # dataset is not part of the other pools -> full difference
+                difference_datasets[dataset_path] = dataset.view()
+                continue
+            # dataset is part of the other pools, check snapshots
+            difference_dataset = dataset.difference(*other_datasets)
+            if difference_dataset.snapshots:
+                # add the difference dataset, which contains the difference snapshots
+                difference_datasets[dataset_path] = difference_dataset
+        difference_pool = self.copy()
+        difference_pool.datasets = difference_datasets
         return difference_pool
 
     def intersection(self, *other_pools: 'Pool') -> 'Pool':
@@ -177,28 +208,23 @@ class Pool(object):
 
         (i. e. all datasets and snapshots that are in both pools.)
         """
-        # base_pool_datasets = set(self.datasets.keys())
-
-        # intersection_datasets = base_pool_datasets.intersection(*(pool.datasets.keys() for pool in other_pools))
-
-        intersection_base_pool = self.view()
         intersection_pool = self.copy()
-        for pool in other_pools:
-            intersection_pool = intersection_pool.copy()
-            intersecting_datasets = set(intersection_base_pool.datasets.keys()).intersection(pool.datasets.keys())
-            for intersecting_dataset in intersecting_datasets:
-                intersection_pool.add_dataset(
-                    intersection_base_pool.datasets[intersecting_dataset].intersection(
-                        pool.datasets[intersecting_dataset]
-                    ))
-            intersection_base_pool = intersection_pool.view()
+        if not other_pools:
+            return intersection_pool
+        # datasets which are part of all pools are intersected once with all of their counterparts.
+        # datasets with an empty snapshot intersection are kept.
+        other_datasets = [pool.datasets for pool in other_pools]
+        for dataset_path, dataset in self.datasets.items():
+            if all(dataset_path in datasets for datasets in other_datasets):
+                intersection_pool.datasets[dataset_path] = dataset.intersection(
+                    *(datasets[dataset_path] for datasets in other_datasets))
         return intersection_pool
 
     def has_incremental_snapshot_refs(self) -> bool:
-        return any(dataset.has_incremental_snapshot_refs() for dataset in self.datasets.values())
+        return any(map(DataSet.has_incremental_snapshot_refs, self.datasets.values()))
 
     def has_snapshots(self):
-        return any(dataset.has_snapshots() for dataset in self.datasets.values())
+        return any(map(DataSet.has_snapshots, self.datasets.values()))
 
     def has_datasets(self):
         return len(self.datasets) > 0
@@ -218,19 +244,31 @@ class Pool(object):
         """
         Drop all datasets which have no snapshots.
         """
-        for dataset in list(self.datasets.values()):
-            if not dataset.has_snapshots():
-                self.remove_dataset(dataset)
-
-    def filter_include_by_zfs_path_prefix(self, zfs_path_prefix: Optional[str]) -> "Pool":
+        # delete in place, the sorted order stays valid if nothing was dropped
+        empty_dataset_paths = [dataset_path for dataset_path, dataset in self.datasets.items()
+                               if not dataset.has_snapshots()]
+        if empty_dataset_paths:
+            for dataset_path in empty_dataset_paths:
+                del self.datasets[dataset_path]
+            self._sorted_cache = None
+
+    def filter_include_by_zfs_path_prefix(self, zfs_path_prefix: str | None) -> "Pool":
         """
         Filter out all elements in the pool, which do not match the given zfs path prefix.
         """
         new_pool = self.copy()
 
+        if zfs_path_prefix is not None:
+            pool_prefix = self._pool_prefix
+            if not (pool_prefix.startswith(zfs_path_prefix) or zfs_path_prefix.startswith(pool_prefix)):
+                # the prefix points to another pool, none of our datasets can match
+                return new_pool
+
         for dataset in self.iter_datasets():
-            # add @ to the zfs path prefix to match the full potential dataset zfs path for snapshots
-            if zfs_path_prefix is not None and not (dataset.zfs_path + "@").startswith(zfs_path_prefix):
+            # use the zfs path with @ to match the full potential dataset zfs path for snapshots.
+            # a snapshot prefix is longer than that and is handled by the dataset filter.
+            if zfs_path_prefix is not None and not (dataset._snapshot_prefix.startswith(zfs_path_prefix)
+                                                    or zfs_path_prefix.startswith(dataset._snapshot_prefix)):
                 continue
             dataset_view = dataset.filter_include_by_zfs_path_prefix(zfs_path_prefix)
             new_pool.add_dataset(dataset_view)
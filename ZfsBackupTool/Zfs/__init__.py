@@ -1,6 +1,11 @@
+from __future__ import annotations
+
 import logging
 import os
-from typing import List, Dict, Iterable, Union, Iterator, Optional
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from sys import intern
 
 from ZfsBackupTool.ShellCommand import ShellCommand
 from .Pool import Pool
@@ -17,53 +22,78 @@ from ..Constants import (BACKUP_FILE_POSTFIX, EXPECTED_CHECKSUM_FILE_POSTFIX, CA
 
 logger = logging.getLogger(__name__)
 
+_SCAN_WORKER_COUNT = 8
+"""maximum number of listing commands that run concurrently while scanning"""
+
+_BACKUP_FILE_POSTFIX_LENGTH = len(BACKUP_FILE_POSTFIX)
+"""length of the backup file postfix, sliced off the backup file names"""
+
 
 class PoolList(object):
     """
     Class to store multiple pools with DIFFERENT pool names in one object.
     """
+    __slots__ = ("pools", "_sorted_cache")
 
-    def __init__(self, *pools: Union[Pool, Iterable[Pool]]):
-        self.pools: Dict[str, Pool] = {}
+    def __init__(self, *pools: Pool | Iterable[Pool]):
+        # pools sorted by their name, invalidated whenever the pools change
+        self._sorted_cache: list[Pool] | None = None
+        all_pools: list[Pool] = []
         for pool in pools:
             if isinstance(pool, Pool):
-                if pool.pool_name in self.pools:
-                    raise ValueError("Pool '{}' already added to the pool list".format(pool.pool_name))
-                self.pools[pool.pool_name] = pool
-
-            elif isinstance(pool, Iterable):
-                for sub_pool in pool:
-                    if sub_pool.pool_name in self.pools:
-                        raise ValueError("Pool '{}' already added to the pool list".format(sub_pool.pool_name))
-                    self.pools[sub_pool.pool_name] = sub_pool
+                all_pools.append(pool)
+            elif hasattr(pool, "__iter__"):
+                all_pools.extend(pool)
             else:
                 raise ValueError("Invalid pool type {}".format(type(pool)))
+        self.pools: dict[str, Pool] = {pool.pool_name: pool for pool in all_pools}
+        if len(self.pools) != len(all_pools):
+            # duplicate pool names collapse in the dict, find the first one for the error
+            pool_names: set[str] = set()
+            for pool in all_pools:
+                if pool.pool_name in pool_names:
+                    raise ValueError("Pool '{}' already added to the pool list".format(pool.pool_name))
+                pool_names.add(pool.pool_name)
 
     def __iter__(self) -> Iterator[Pool]:
-        for pool_name in sorted(self.pools.keys()):
-            yield self.pools[pool_name]
+        # the cached list is replaced, not modified, on changes. removing pools while iterating is safe.
+        return iter(self._get_sorted())
 
-    def __contains__(self, item: Pool):
-        return item in self.pools.values()
+    def _get_sorted(self) -> list[Pool]:
+        """
+        Returns the cached sorted pool list. The returned list must not be modified.
+        """
+        if self._sorted_cache is None:
+            self._sorted_cache = [self.pools[pool_name] for pool_name in sorted(self.pools.keys())]
+        return self._sorted_cache
+
+    def __contains__(self, item: Pool | str):
+        if isinstance(item, str):
+            # membership by pool name
+            return item in self.pools
+        if isinstance(item, Pool):
+            # pools are unique by name, only the pool with the same name has to be compared
+            pool = self.pools.get(item.pool_name)
+            return pool is not None and (pool is item or pool == item)
+        return False
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, PoolList):
             return False
-        # our pools and the other pools must be the same
-        if set(self.pools.keys()) != set(other.pools.keys()):
-            return False
-        # finally check the pools itself and other attributes
-        for pool_name in self.pools.keys():
-            if self.pools[pool_name] != other.pools[pool_name]:
-                return False
-        return True
+        # the dict comparison checks the sizes, pool names and pools in one pass, identical pools are not compared
+        return self.pools == other.pools
 
     def copy(self):
         """
         This method creates a new PoolList object with the same pool names as the current instance.
         However, the pools are not copied to the new instance.
         """
-        return PoolList(*[pool.copy() for pool in self.pools.values()])
+        # the pool names are already unique, the checks of __init__ are not needed
+        copy_pool_list = PoolList()
+        copy_pool_list.pools = {pool_name: pool.copy() for pool_name, pool in self.pools.items()}
+        return copy_pool_list
 
     def prefixed_view(self, prefix: str, deshift: bool = False):
         """
@@ -85,23 +115,29 @@ class PoolList(object):
         Creates a full copy of the current PoolList instance including all sub-references.
         Sub-references are also copied and not just referenced.
         """
-        return self.prefixed_view('')
+        # no shifting needed, the pool names stay the same and unique
+        view_pool_list = PoolList()
+        view_pool_list.pools = {pool_name: pool.view() for pool_name, pool in self.pools.items()}
+        return view_pool_list
 
     def add_pool(self, pool: Pool):
         if pool.pool_name in self.pools:
             raise ZfsAddError("Pool '{}' already added to the pool list".format(pool.pool_name))
         self.pools[pool.pool_name] = pool
+        self._sorted_cache = None
 
     def remove_pool(self, pool: Pool):
         if pool.pool_name not in self.pools:
             raise ZfsResolveError("Pool '{}' not found in the pool list".format(pool.pool_name))
         self.pools.pop(pool.pool_name)
+        self._sorted_cache = None
 
     def add_dataset(self, dataset: DataSet):
         poolname = dataset.pool_name
         if poolname not in self.pools:
             pool = Pool(poolname)
             self.pools[poolname] = pool
+            self._sorted_cache = None
         else:
             pool = self.pools[poolname]
         pool.add_dataset(dataset)
@@ -113,28 +149,25 @@ class PoolList(object):
         pool.remove_dataset(dataset)
 
     def iter_pools(self) -> Iterable[Pool]:
-        for pool in self:
-            yield pool
+        return iter(self)
 
     def iter_datasets(self) -> Iterable[DataSet]:
-        for pool in self:
-            for dataset in pool:
-                yield dataset
+        return chain.from_iterable(self)
 
     def iter_snapshots(self) -> Iterable[Snapshot]:
-        for pool in self:
-            for dataset in pool:
-                for snapshot in dataset:
-                    yield snapshot
+        return chain.from_iterable(chain.from_iterable(self))
 
-    def resolve_zfs_path(self, zfs_path: str) -> Union[Pool, DataSet, Snapshot]:
+    def resolve_zfs_path(self, zfs_path: str) -> Pool | DataSet | Snapshot:
         """
         Resolve a ZFS path to a Pool, DataSet or Snapshot object.
 
         :raises ZfsResolveError: If the pool name is not found in the pool list.
         """
-        pool_name, _ = zfs_path.split("/", 1)
+        pool_name, separator, _ = zfs_path.partition("/")
         if pool_name in self.pools:
+            if not separator:
+                # bare pool name
+                return self.pools[pool_name]
             return self.pools[pool_name].resolve_zfs_path(zfs_path)
         raise ZfsResolveError("Pool '{}' not found in the pool list".format(pool_name))
 
@@ -144,30 +177,12 @@ class PoolList(object):
 
     @classmethod
     def merge(cls, *others: 'PoolList') -> 'PoolList':
-        equal_pools: Dict[str, List[Pool]] = {}
-        for pool_list in others:
-            if isinstance(pool_list, PoolList):
-                for pool in pool_list:
-                    if pool.pool_name in equal_pools:
-                        equal_pools[pool.pool_name].append(pool)
-                    else:
-                        equal_pools[pool.pool_name] = [pool]
-            elif isinstance(pool_list, Iterable):
-                for sub_pool in others:
-                    for pool in sub_pool:
-                        if pool.pool_name in equal_pools:
-                            equal_pools[pool.pool_name].append(pool)
-                        else:
-                            equal_pools[pool.pool_name] = [pool]
-            else:
-                raise ValueError("Invalid pool type {}".format(type(pool_list)))
+        equal_pools = _group_pools_by_name(others)
 
-        merged_pools = []
-        for pool_name, pool_list in equal_pools.items():
-            merged_pool = Pool.merge(*pool_list)
-            merged_pools.append(merged_pool)
-
-        return PoolList(merged_pools)
+        # the grouped pool names are unique, the result dict is filled directly
+        merged_pool_list = PoolList()
+        merged_pool_list.pools = {pool_name: Pool.merge(*pool_list) for pool_name, pool_list in equal_pools.items()}
+        return merged_pool_list
 
     def difference(self, *other_pool_lists: 'PoolList') -> 'PoolList':
         """
@@ -175,75 +190,53 @@ class PoolList(object):
 
         (i.e. all pools, datasets and snapshots that are in this pool list but not the others.)
         """
-        other_pools = {}
-        for pool_list in other_pool_lists:
-            for pool in pool_list:
-                if pool.pool_name not in other_pools:
-                    other_pools[pool.pool_name] = [pool]
-                else:
-                    other_pools[pool.pool_name].append(pool)
+        other_pools = _group_pools_by_name(other_pool_lists)
 
         diff_poollist = PoolList()
-        for our_pool in self.pools.values():
-            if our_pool.pool_name in other_pools:
-                diff_pool = our_pool.difference(*other_pools[our_pool.pool_name])
+        for pool_name, our_pool in self.pools.items():
+            equal_pools = other_pools.get(pool_name)
+            if equal_pools is not None:
+                diff_pool = our_pool.difference(*equal_pools)
                 diff_poollist.add_pool(diff_pool)
             else:
                 diff_poollist.add_pool(our_pool.view())
-        full_diffs = set(self.pools.keys()).difference(set(other_pools.keys()))
-        for full_diff in full_diffs:
-            assert full_diff in diff_poollist.pools
-            if full_diff not in diff_poollist.pools:
-                diff_poollist.add_pool(self.pools[full_diff].view())
         return diff_poollist
 
     def intersection(self, *other_pool_lists: 'PoolList') -> 'PoolList':
-        equal_pools: Dict[str, List[Pool]] = {}
-        for pool in self.pools.values():
-            equal_pools[pool.pool_name] = [pool]
-        for item in other_pool_lists:
-            if isinstance(item, PoolList):
-                for pool in item:
-                    if not pool.pool_name in equal_pools:
-                        equal_pools[pool.pool_name] = []
-                    equal_pools[pool.pool_name].append(pool)
-            elif isinstance(item, Iterable):
-                sub_pool: PoolList
-                for sub_pool in item:
-                    for pool in sub_pool:
-                        if not pool.pool_name in equal_pools:
-                            equal_pools[pool.pool_name] = []
-                        equal_pools[pool.pool_name].append(pool)
-            else:
-                raise ValueError("Invalid pool type {}".format(type(item)))
-
-        intersection_pools = []
+        if not other_pool_lists:
+            # every pool would be alone in its group, the intersection is empty
+            return PoolList()
+        equal_pools = _group_pools_by_name(other_pool_lists,
+                                           {pool_name: [pool] for pool_name, pool in self.pools.items()})
+
+        # the grouped pool names are unique, the result dict is filled directly
+        intersection_pool_list = PoolList()
+        intersection_pools = intersection_pool_list.pools
         for pool_name, pool_list in equal_pools.items():
             if len(pool_list) == 1:
                 # skip pools with only one pool, second comparison pool would be an empty pool
                 # equal example: set((1,2,3)).intersection(set()) == set()
                 continue
             base_pool = pool_list.pop()
-            intersection_pool = base_pool.intersection(*pool_list)
-            intersection_pools.append(intersection_pool)
+            intersection_pools[pool_name] = base_pool.intersection(*pool_list)
 
-        return PoolList(intersection_pools)
+        return intersection_pool_list
 
     def has_incremental_snapshot_refs(self) -> bool:
-        return any(pool.has_incremental_snapshot_refs() for pool in self.pools.values())
+        return any(map(Pool.has_incremental_snapshot_refs, self.pools.values()))
 
     def has_snapshots(self):
-        return any(pool.has_snapshots() for pool in self.pools.values())
+        return any(map(Pool.has_snapshots, self.pools.values()))
 
     def has_datasets(self):
-        return any(pool.has_datasets() for pool in self.pools.values())
+        return any(map(Pool.has_datasets, self.pools.values()))
 
     def get_dataset_by_path(self, zfs_path: str):
         """
         : raises ZfsResolveError: If the pool name is not found in the pool list.
         """
-        pool_name, dataset_name = zfs_path.split("/", 1)
-        dataset_name = "{}/{}".format(pool_name, dataset_name.split("@", 1)[0])
+        dataset_name = zfs_path.partition("@")[0]
+        pool_name = dataset_name.partition("/")[0]
         if pool_name not in self.pools:
             raise ZfsResolveError("Pool '{}' not found in the pool list".format(pool_name))
         if dataset_name not in self.pools[pool_name].datasets:
@@ -275,11 +268,14 @@ class PoolList(object):
         """
         Drop all pools that have no datasets from this PoolList.
         """
-        empty_pools = [pool for pool in self.pools.values() if not pool.has_datasets()]
-        for pool in empty_pools:
-            self.remove_pool(pool)
-
-    def filter_include_by_zfs_path_prefix(self, zfs_path_prefix: Optional[str]) -> "PoolList":
+        # delete in place, the sorted order stays valid if nothing was dropped
+        empty_pool_names = [pool_name for pool_name, pool in self.pools.items() if not pool.has_datasets()]
+        if empty_pool_names:
+            for pool_name in empty_pool_names:
+                del self.pools[pool_name]
+            self._sorted_cache = None
+
+    def filter_include_by_zfs_path_prefix(self, zfs_path_prefix: str | None) -> "PoolList":
         """
         Filter out all elements in the pool, which do not match the given zfs path prefix.
         """
@@ -293,6 +289,79 @@ class PoolList(object):
         return new_poollist
 
 
+def _group_pools_by_name(pool_lists: Iterable[PoolList | Iterable[PoolList | Pool]],
+                         equal_pools: dict[str, list[Pool]] | None = None) -> dict[str, list[Pool]]:
+    """
+    Group the pools of the given pool lists by their pool name. Pool lists can also be given as an iterable of
+    pool lists or pools. The pools are added to the given equal_pools dict, if any.
+
+    :raises ValueError: If an argument is neither a pool list nor an iterable of pool lists or pools.
+    """
+    if equal_pools is None:
+        equal_pools = {}
+    setdefault = equal_pools.setdefault
+    for pool_list in pool_lists:
+        # dispatch once per argument, all pools are grouped by the same loop
+        if isinstance(pool_list, PoolList):
+            pools: Iterable[Pool] = pool_list.pools.values()
+        elif hasattr(pool_list, "__iter__"):
+            pools = _flatten_pools(pool_list)
+        else:
+            raise ValueError("Invalid pool type {}".format(type(pool_list)))
+        for pool in pools:
+            setdefault(pool.pool_name, []).append(pool)
+    return equal_pools
+
+
+def _flatten_pools(items: Iterable[PoolList | Pool]) -> Iterator[Pool]:
+    """
+    Yield the pools of an iterable of pool lists and pools.
+
+    :raises ValueError: If an item is neither a pool list nor a pool.
+    """
+    for item in items:
+        if isinstance(item, Pool):
+            yield item
+        elif isinstance(item, PoolList):
+            yield from item.pools.values()
+        else:
+            raise ValueError("Invalid pool type {}".format(type(item)))
+
+
+def _scan_zfs_pool(shell_command: ShellCommand, pool_name: str, include_dataset_sizes: bool) -> Pool:
+    """
+    Scan a single ZFS pool for its datasets and snapshots.
+    Snapshots and dataset sizes are listed recursively for the whole pool, not per dataset.
+    """
+    pool = Pool(pool_name)
+    pool_dataset_names = shell_command.list_datasets(pool_name)
+    logger.debug("Found datasets for pool {}: {}".format(pool_name, pool_dataset_names))
+    pool_dataset_sizes = shell_command.get_dataset_sizes_recursive(pool_name) if include_dataset_sizes else {}
+    pool_snapshots = shell_command.list_snapshots_with_creation_time_recursive(pool_name)
+
+    # add datasets, add snapshots
+    for dataset_name in pool_dataset_names:
+        dataset = DataSet(pool_name, dataset_name)
+        # the sizes are listed by a separate zfs call, a dataset created in between has no size
+        dataset_size = pool_dataset_sizes.get(dataset.zfs_path)
+        if dataset_size is not None:
+            dataset.dataset_size = dataset_size
+        pool.add_dataset(dataset)
+
+        dataset_snapshot_names_creation_times = pool_snapshots.get(dataset.zfs_path, [])
+        logger.debug("Found snapshots for dataset {}: {}".format(
+            dataset.zfs_path,
+            [snapshot_name for snapshot_name, _ in dataset_snapshot_names_creation_times]))
+
+        for snapshot_name, creation_time in dataset_snapshot_names_creation_times:
+            # the same backup snapshot names repeat across all datasets, they are stored only once
+            snapshot = Snapshot(pool_name, dataset_name, intern(snapshot_name))
+            snapshot.set_creation_time(creation_time)
+            dataset.add_snapshot(snapshot)
+
+    return pool
+
+
 def scan_zfs_pools(shell_command: ShellCommand, include_dataset_sizes=False) -> PoolList:
     """
     Scan the local system for ZFS datasets.
@@ -300,27 +369,11 @@ def scan_zfs_pools(shell_command: ShellCommand, include_dataset_sizes=False) ->
     # first scan for pools
     pool_names = shell_command.list_pools()
     logger.debug("Found pools: {}".format(pool_names))
-    pools = [Pool(pool_name) for pool_name in pool_names]
-
-    # iter pools, add datasets, add snapshots
-    for pool in pools:
-        pool_dataset_names = shell_command.list_datasets(pool.pool_name)
-        logger.debug("Found datasets for pool {}: {}".format(pool.pool_name, pool_dataset_names))
-        for dataset_name in pool_dataset_names:
-            dataset = DataSet(pool.pool_name, dataset_name)
-            if include_dataset_sizes:
-                dataset.dataset_size = shell_command.get_dataset_size(dataset.zfs_path, recursive=False)
-            pool.add_dataset(dataset)
-
-            dataset_snapshot_names_creation_times = shell_command.list_snapshots_with_creation_time(dataset.zfs_path)
-            logger.debug("Found snapshots for dataset {}: {}".format(
-                dataset.zfs_path,
-                [snapshot_name for snapshot_name, _ in dataset_snapshot_names_creation_times]))
-
-            for snapshot_name, creation_time in dataset_snapshot_names_creation_times:
-                snapshot = Snapshot(pool.pool_name, dataset.dataset_name, snapshot_name)
-                snapshot.set_creation_time(creation_time)
-                dataset.add_snapshot(snapshot)
+
+    # the pools are independent and are scanned concurrently
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKER_COUNT) as executor:
+        pools = list(executor.map(lambda pool_name: _scan_zfs_pool(shell_command, pool_name, include_dataset_sizes),
+                                  pool_names))
 
     return PoolList(*pools)
 
@@ -329,7 +382,7 @@ def scan_filebased_zfs_pools(shell_command: ShellCommand, target_pool_storage_pa
     discovered_pools: PoolList = PoolList()
 
     if not shell_command.target_dir_exists(target_pool_storage_path):
-        return PoolList(discovered_pools)
+        return discovered_pools
 
     _, pool_names = shell_command.target_list_directory(target_pool_storage_path)
     logger.debug("Found pools: {}".format(pool_names))
@@ -337,56 +390,59 @@ def scan_filebased_zfs_pools(shell_command: ShellCommand, target_pool_storage_pa
         pool = Pool(pool_name)
         discovered_pools.add_pool(pool)
 
-    for pool in discovered_pools:
-        pool_target_path = os.path.join(target_pool_storage_path, pool.pool_name)
-        # prime dataset_dirs with the dataset names
-        files, dataset_names = shell_command.target_list_directory(pool_target_path)
-        logger.debug("Found top level datasets for pool {}: {}".format(pool.pool_name, dataset_names))
-
-        # analyze datasets while we have some
-        while dataset_names:
-            dataset_name = dataset_names.pop()
-            dataset_zfs_path = pool.resolve_dataset_name(dataset_name)
-            dataset_target_path = os.path.join(target_pool_storage_path, dataset_zfs_path)
-
-            dataset_dir_file_names, dataset_dir_subdir_names = shell_command.target_list_directory(
-                dataset_target_path)
-            logger.debug("Found files for dataset {}: {}".format(dataset_zfs_path, dataset_dir_file_names))
-            logger.debug("Found folders for dataset {}: {}".format(dataset_zfs_path, dataset_dir_subdir_names))
-
-            # filter out checksum files
-            snapshot_files = [snapshot_name
-                              for snapshot_name in dataset_dir_file_names
-                              if snapshot_name.endswith(BACKUP_FILE_POSTFIX)]
-
-            # snapshot names are the ones that are not directories
-            if snapshot_files:
-                if dataset_zfs_path in pool.datasets:
-                    dataset = pool.datasets[dataset_zfs_path]
-                else:
-                    dataset = DataSet(pool.pool_name, dataset_name)
-                    logger.debug("Adding dataset: {}".format(dataset_name))
-                    pool.add_dataset(dataset)
-                for snapshot_file in snapshot_files:
-                    snapshot_name = snapshot_file.replace(BACKUP_FILE_POSTFIX, "")
-                    snapshot_checksum_file = snapshot_file + EXPECTED_CHECKSUM_FILE_POSTFIX
-                    if snapshot_checksum_file not in dataset_dir_file_names:
-                        # skip snapshots without checksum file, verification is not possible without it
-                        continue
-                    snapshot_calculated_checksum_file = snapshot_file + CALCULATED_CHECKSUM_FILE_POSTFIX
-                    if snapshot_calculated_checksum_file not in dataset_dir_file_names:
-                        # skip snapshots without a calculated checksum file, verification is still pending for this
-                        # snapshot/file
-                        continue
-                    logger.debug("found snapshot: {}".format(snapshot_name))
-                    if snapshot_name in dataset.snapshots:
-                        continue
-                    snapshot = Snapshot(pool.pool_name, dataset.dataset_name, snapshot_name)
-                    dataset.add_snapshot(snapshot)
-
-            # dataset names are the ones that are directories
-            for dataset_sub_dir in dataset_dir_subdir_names:
-                sub_dataset_name = os.path.join(dataset_name, dataset_sub_dir)
-                dataset_names.append(sub_dataset_name)
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKER_COUNT) as executor:
+        # every pool directory is walked with a single command, the pools are walked concurrently
+        pools = list(discovered_pools)
+        # joined once, the pool directories are built by concatenation
+        pool_storage_path_prefix = os.path.join(target_pool_storage_path, "")
+        pool_walks = executor.map(
+            lambda pool: shell_command.target_walk_directory(pool_storage_path_prefix + pool.pool_name),
+            pools)
+        for pool, pool_directories in zip(pools, pool_walks):
+            logger.debug("Found top level datasets for pool {}: {}".format(pool.pool_name, pool_directories[''][1]))
+
+            # every directory below the pool directory is a dataset
+            for dataset_name, (dataset_dir_file_names, dataset_dir_subdir_names) in pool_directories.items():
+                if not dataset_name:
+                    # the pool directory itself
+                    continue
+                dataset_zfs_path = pool.resolve_dataset_name(dataset_name)
+                logger.debug("Found files for dataset {}: {}".format(dataset_zfs_path, dataset_dir_file_names))
+                logger.debug("Found folders for dataset {}: {}".format(dataset_zfs_path, dataset_dir_subdir_names))
+
+                # set for the checksum file lookups below
+                dataset_dir_file_name_set = set(dataset_dir_file_names)
+
+                # filter out checksum files
+                snapshot_files = [snapshot_name
+                                  for snapshot_name in dataset_dir_file_names
+                                  if snapshot_name.endswith(BACKUP_FILE_POSTFIX)]
+
+                # snapshot names are the ones that are not directories
+                if snapshot_files:
+                    if dataset_zfs_path in pool.datasets:
+                        dataset = pool.datasets[dataset_zfs_path]
+                    else:
+                        dataset = DataSet(pool.pool_name, dataset_name)
+                        logger.debug("Adding dataset: {}".format(dataset_name))
+                        pool.add_dataset(dataset)
+                    for snapshot_file in snapshot_files:
+                        # only strip the trailing postfix, the name itself may contain it
+                        snapshot_name = snapshot_file[:-_BACKUP_FILE_POSTFIX_LENGTH]
+                        snapshot_checksum_file = snapshot_file + EXPECTED_CHECKSUM_FILE_POSTFIX
+                        if snapshot_checksum_file not in dataset_dir_file_name_set:
+                            # skip snapshots without checksum file, verification is not possible without it
+                            continue
+                        snapshot_calculated_checksum_file = snapshot_file + CALCULATED_CHECKSUM_FILE_POSTFIX
+                        if snapshot_calculated_checksum_file not in dataset_dir_file_name_set:
+                            # skip snapshots without a calculated checksum file, verification is still pending for
+                            # this snapshot/file
+                            continue
+                        logger.debug("found snapshot: {}".format(snapshot_name))
+                        if dataset.resolve_snapshot_name(snapshot_name) in dataset.snapshots:
+                            continue
+                        # the same backup snapshot names repeat across all datasets, they are stored only once
+                        snapshot = Snapshot(pool.pool_name, dataset.dataset_name, intern(snapshot_name))
+                        dataset.add_snapshot(snapshot)
 
     return discovered_pools